@@ -1,25 +1,37 @@
+import functools
 import requests
 import logging
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, HTTPError, Timeout, ConnectionError
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 from tidylib import tidy_document
+from urllib3.util.retry import Retry
 
 
 class TimetableFetcher:
     """Fetches the HTML content of the Virginia Tech Timetable website for a specific term and subject."""
 
-    def __init__(self, term: str):
-        """Constructs a fetcher with the specified academic term and subject code.
+    def __init__(self, term: str, pool_size: int = 16):
+        """Constructs a fetcher for the specified academic term.
 
         Args:
             term (str): The academic term year code (e.g., "202509" for Fall 2025)
-            subject (str): The subject code (e.g., "CS" for Computer Science)
+            pool_size (int): Number of keep-alive connections kept open; should be
+                             at least the number of concurrent requests. Defaults to 16
         """
         self.base_url = "https://selfservice.banner.vt.edu/ssb/HZSKVTSC.P_ProcRequest"
         self.term = term
 
-        # initialize a persistent session object
+        # initialize a persistent session object so connections are pooled and
+        # reused across subjects. The timetable search POST is read-only, so it
+        # is safe to retry on transient failures. The pool is sized so subjects
+        # scraped concurrently each get their own keep-alive connection.
         self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, allowed_methods={"POST"})
+        self.session.mount(
+            "https://", HTTPAdapter(max_retries=retries, pool_maxsize=pool_size)
+        )
 
         # set cookie
         # self.session.cookies.update(
@@ -65,21 +77,9 @@ class TimetableFetcher:
         Raises:
             RuntimeError: If there is a network-related error or HTTP error.
         """
-        # construct payload dynamically
-        payload = {
-            "CAMPUS": "0",
-            "TERMYEAR": self.term,
-            "CORE_CODE": "AR%",
-            "subj_code": subject if subject is not None else "%",
-            "SCHDTYPE": "%",
-            "CRSE_NUMBER": "",
-            "crn": "",
-            "open_only": "",
-            "disp_comments_in": "",
-            "sess_code": "%",
-            "BTN_PRESSED": "FIND class sections",
-            "inst_name": "",
-        }
+        payload = self._build_payload(
+            self.term, subject if subject is not None else "%"
+        )
 
         response = None
         try:
@@ -94,8 +94,10 @@ class TimetableFetcher:
             response.raise_for_status()
             logging.info(f"Timetable fetch successful for subject '{subject}'.")
 
-            # decode using detected encoding, fall back to utf-8
-            response.encoding = response.apparent_encoding or "utf-8"
+            # trust the charset the server declares; only sniff the body when the
+            # Content-Type header has none, falling back to utf-8
+            if "charset=" not in response.headers.get("Content-Type", "").lower():
+                response.encoding = response.apparent_encoding or "utf-8"
 
             return self.fix_html(response.text)
 
@@ -123,6 +125,38 @@ class TimetableFetcher:
             )
             return None  # Return None on other request errors
 
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _build_payload(term: str, subject: str) -> Mapping[str, str]:
+        """Builds the form payload for a term and subject, memoized per pair.
+
+        The payload is returned as a read-only mapping so the cached instance
+        can be shared safely between requests.
+
+        Args:
+            term (str): The academic term year code (e.g., "202509")
+            subject (str): The subject code (e.g., "CS"), or "%" for all subjects
+
+        Returns:
+            Mapping[str, str]: The POST form fields for the timetable search.
+        """
+        return MappingProxyType(
+            {
+                "CAMPUS": "0",
+                "TERMYEAR": term,
+                "CORE_CODE": "AR%",
+                "subj_code": subject,
+                "SCHDTYPE": "%",
+                "CRSE_NUMBER": "",
+                "crn": "",
+                "open_only": "",
+                "disp_comments_in": "",
+                "sess_code": "%",
+                "BTN_PRESSED": "FIND class sections",
+                "inst_name": "",
+            }
+        )
+
     def fix_html(self, html: str) -> str:
         cleaned, errors = tidy_document(html, options={"numeric-entities": 1})
         return cleaned
@@ -499,7 +499,7 @@ def scrape_subjects(subjects: list[str], fetcher: TimetableFetcher) -> str:
             continue
 
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
             section_table = soup.find("table", class_="dataentrytable")
         except Exception as e:
             logging.error(f"Failed to parse HTML for subject {subject}: {e}")
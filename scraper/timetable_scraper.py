@@ -1,10 +1,13 @@
+import copy
+import functools
 import json
 import logging
 import re
-from collections import defaultdict
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from .timetable_fetcher import TimetableFetcher
 
@@ -29,17 +32,51 @@ DAY_MAPPING = {
     "U": 7,
 }
 
+# default number of subjects scraped concurrently; the fetcher's connection
+# pool is sized to match
+MAX_WORKERS = 8
+
+# subject code option in the term dropdown script, e.g.
+# new Option("CS - Computer Science","CS",false, true);
+SUBJECT_OPTION_PATTERN = re.compile(r'new Option\(".*?",\s*"([A-Z0-9]+)"', re.ASCII)
+
+# course identifier in "SUBJECT-####" format, e.g. CS-2114
+COURSE_PATTERN = re.compile(r"^[A-Za-z]+-\d{4}$")
+
+# only the timetable itself is scraped, skip building the rest of the page
+SECTION_TABLE_STRAINER = SoupStrainer("table", class_="dataentrytable")
+
+# column count -> row type for rows that start a new section
+SECTION_ROW_TYPES = {
+    # online async classes, research, independent study, internship, etc.
+    # All should be 'ARR' for times
+    12: "arranged",
+    # regular in person classes or sync online classes
+    13: "regular",
+}
+
+# bold text in column 4 of rows that add meeting times to the previous section
+ADDITIONAL_TIMES_MARKER = "* Additional Times *"
+
+# column count -> is_online for "* Additional Times *" rows
+ADDITIONAL_TIMES_ROW_TYPES = {
+    9: True,
+    10: False,
+}
+
 
 # ======================================================
 # Helper Functions
 # ======================================================
 
 
+@functools.lru_cache(maxsize=512)
 def parse_time(time_str: Optional[str]) -> str:
     """Convert the time string from 12-hour format to 24-hour format.
 
     Handles university timetable time formats and converts them to standardized
-    24-hour format for consistent data processing.
+    24-hour format for consistent data processing. Results are memoized since
+    a term only has a few dozen distinct begin/end times.
 
     Args:
         time_str(Optional[str]): Time string in format "HH:MMAM/PM" or special
@@ -51,15 +88,12 @@ def parse_time(time_str: Optional[str]) -> str:
     if not time_str or time_str == "----- (ARR) -----":
         return "ARR"
 
-    time_part = time_str[:-2].strip()
-    am_pm = time_str[-2:].strip()
-
-    hour, minute = map(int, time_part.split(":"))
+    hour_str, minute_str = time_str[:-2].split(":")
+    is_pm = time_str[-2:] == "PM"
 
-    if am_pm == "PM" and hour != 12:
-        hour += 12
-    elif am_pm == "AM" and hour == 12:
-        hour = 0
+    # 12AM -> 0 and 12PM -> 12 fall out of the modulo, no AM/PM branching
+    hour = int(hour_str) % 12 + (12 if is_pm else 0)
+    minute = int(minute_str)
 
     # format specifier:
     # 0 - pad with zeros
@@ -68,11 +102,29 @@ def parse_time(time_str: Optional[str]) -> str:
     return f"{hour:02d}:{minute:02d}"
 
 
+@functools.lru_cache(maxsize=128)
+def parse_days(days: str) -> tuple[int, ...]:
+    """Convert space-separated day abbreviations into day numbers.
+
+    Only a handful of day combinations exist in a term, so results are
+    memoized per distinct string.
+
+    Args:
+        days (str): Space-separated day abbreviations (e.g., "M W F")
+
+    Returns:
+        tuple[int, ...]: Day numbers from DAY_MAPPING (e.g., (1, 3, 5))
+    """
+    return tuple(DAY_MAPPING[day] for day in days.split())
+
+
 def safe_extract_text(element: Tag, selector: Optional[str] = None) -> Optional[str]:
     """Safely extract text content from BeautifulSoup HTML elements.
 
     Provides text extraction with CSS selector support and handles
-    edge cases like None elements, empty text, and "N/A" values.
+    edge cases like None elements, empty text, and "N/A" values. Anything
+    that isn't a Tag, including a bare NavigableString, yields None whether
+    or not a selector is given.
 
     Args:
         element (Tag): BeautifulSoup Tag element to extract text from
@@ -82,18 +134,32 @@ def safe_extract_text(element: Tag, selector: Optional[str] = None) -> Optional[
         Optional[str]: Extracted text content, or None if extraction fails or
                        text is empty/invalid
     """
-    if not element or not isinstance(element, Tag):
+    # one rule for both paths: str and NavigableString have a find() too, but it
+    # returns an index rather than a child element
+    if not isinstance(element, Tag):
         return None
 
-    if selector:
-        found = element.find(selector)
-        if not found or not isinstance(found, Tag):
-            return None
-        element = found
+    found = element.find(selector) if selector else element
+    if found is None:
+        return None
 
-    text = element.get_text(strip=True)
+    text = found.get_text(strip=True)
+    return text if text and text != "N/A" else None
 
-    return text if text and text != "" and text != "N/A" else None
+
+def intern_text(text: Optional[str]) -> Optional[str]:
+    """Intern a low-cardinality cell value so equal values share one string.
+
+    Values like the course code, schedule type, modality, credit hours, days,
+    and exam code repeat across thousands of sections in a full-term scrape.
+
+    Args:
+        text (Optional[str]): Extracted cell text, or None
+
+    Returns:
+        Optional[str]: The interned text, or None if no text was given
+    """
+    return sys.intern(text) if text is not None else None
 
 
 def is_additional_times_row(cols: list[Tag], expected_length: int) -> bool:
@@ -119,7 +185,7 @@ def is_additional_times_row(cols: list[Tag], expected_length: int) -> bool:
     b_element = col_four.find("b")
     return (
         b_element is not None
-        and b_element.get_text(strip=True) == "* Additional Times *"
+        and b_element.get_text(strip=True) == ADDITIONAL_TIMES_MARKER
     )
 
 
@@ -128,14 +194,74 @@ def is_additional_times_row(cols: list[Tag], expected_length: int) -> bool:
 # ====================================================================
 
 
+def parse_arranged_section(cols: list[Tag]) -> dict[str, Optional[str]]:
+    """Parse the 12-column layout used by arranged sections (online async,
+    research, independent study, etc.), which have a single time column.
+
+    Args:
+        cols (list[Tag]): List of table cell elements containing course data
+
+    Returns:
+        dict[str, Optional[str]]: Dictionary containing parsed course data fields
+    """
+    return {
+        "crn": safe_extract_text(cols[0], "b"),
+        "course": intern_text(safe_extract_text(cols[1], "font")),
+        "title": safe_extract_text(cols[2]),
+        "schedule_type": intern_text(safe_extract_text(cols[3])),
+        "modality": intern_text(safe_extract_text(cols[4], "p")),
+        "credit_hours": intern_text(safe_extract_text(cols[5])),
+        "capacity": safe_extract_text(cols[6]),
+        "instructor": safe_extract_text(cols[7]),
+        "days": intern_text(safe_extract_text(cols[8])),
+        "time": safe_extract_text(cols[9]),
+        "location": safe_extract_text(cols[10]),
+        "exam_code": intern_text(safe_extract_text(cols[11], "a")),
+    }
+
+
+def parse_regular_section(cols: list[Tag]) -> dict[str, Optional[str]]:
+    """Parse the 13-column layout used by regularly scheduled sections, which
+    have separate begin and end time columns.
+
+    Args:
+        cols (list[Tag]): List of table cell elements containing course data
+
+    Returns:
+        dict[str, Optional[str]]: Dictionary containing parsed course data fields
+    """
+    return {
+        "crn": safe_extract_text(cols[0], "b"),
+        "course": intern_text(safe_extract_text(cols[1], "font")),
+        "title": safe_extract_text(cols[2]),
+        "schedule_type": intern_text(safe_extract_text(cols[3])),
+        "modality": intern_text(safe_extract_text(cols[4], "p")),
+        "credit_hours": intern_text(safe_extract_text(cols[5])),
+        "capacity": safe_extract_text(cols[6]),
+        "instructor": safe_extract_text(cols[7]),
+        "days": intern_text(safe_extract_text(cols[8])),
+        "begin_time": safe_extract_text(cols[9]),
+        "end_time": safe_extract_text(cols[10]),
+        "location": safe_extract_text(cols[11]),
+        "exam_code": intern_text(safe_extract_text(cols[12], "a")),
+    }
+
+
+# row type -> column layout parser
+SECTION_PARSERS = {
+    "arranged": parse_arranged_section,
+    "regular": parse_regular_section,
+}
+
+
 def parse_new_section_data(
     cols: list[Tag], row_type: str
 ) -> Optional[dict[str, Optional[str]]]:
     """Parse course section data from timetable table row columns.
 
     Extracts structured course information from HTML table cells based on
-    the row type (arranged vs regular schedule). Handles different column
-    layouts for different types of courses.
+    the row type (arranged vs regular schedule). Each row type has its own
+    column layout parser, looked up once in SECTION_PARSERS.
 
     Args:
         cols (list[Tag]): List of table cell elements containing course data
@@ -146,41 +272,12 @@ def parse_new_section_data(
         Optional[dict[str, Optional[str]]]: Dictionary containing parsed course
                                            data fields, or None if parsing fails
     """
-    if row_type == "arranged":
-        return {
-            "crn": safe_extract_text(cols[0], "b"),
-            "course": safe_extract_text(cols[1], "font"),
-            "title": safe_extract_text(cols[2]),
-            "schedule_type": safe_extract_text(cols[3]),
-            "modality": safe_extract_text(cols[4], "p"),
-            "credit_hours": safe_extract_text(cols[5]),
-            "capacity": safe_extract_text(cols[6]),
-            "instructor": safe_extract_text(cols[7]),
-            "days": safe_extract_text(cols[8]),
-            "time": safe_extract_text(cols[9]),
-            "location": safe_extract_text(cols[10]),
-            "exam_code": safe_extract_text(cols[11], "a"),
-        }
+    section_parser = SECTION_PARSERS.get(row_type)
+    if section_parser is None:
+        logging.warning(f"Row type not recognized: {row_type}")
+        return {}
 
-    elif row_type == "regular":
-        return {
-            "crn": safe_extract_text(cols[0], "b"),
-            "course": safe_extract_text(cols[1], "font"),
-            "title": safe_extract_text(cols[2]),
-            "schedule_type": safe_extract_text(cols[3]),
-            "modality": safe_extract_text(cols[4], "p"),
-            "credit_hours": safe_extract_text(cols[5]),
-            "capacity": safe_extract_text(cols[6]),
-            "instructor": safe_extract_text(cols[7]),
-            "days": safe_extract_text(cols[8]),
-            "begin_time": safe_extract_text(cols[9]),
-            "end_time": safe_extract_text(cols[10]),
-            "location": safe_extract_text(cols[11]),
-            "exam_code": safe_extract_text(cols[12], "a"),
-        }
-
-    logging.warning(f"Row type not recognized: {row_type}")
-    return {}
+    return section_parser(cols)
 
 
 def determine_meeting_times(
@@ -211,16 +308,14 @@ def determine_meeting_times(
     formatted_begin_time = parse_time(begin_time)
     formatted_end_time = parse_time(end_time)
 
-    meeting_times = []
-    for day in days.split():
-        meeting_time = {
-            "day": DAY_MAPPING[day],
+    return [
+        {
+            "day": day,
             "begin_time": formatted_begin_time,
             "end_time": formatted_end_time,
         }
-        meeting_times.append(meeting_time)
-
-    return meeting_times
+        for day in parse_days(days)
+    ]
 
 
 def create_section_object(
@@ -285,13 +380,16 @@ def parse_additional_times_row(
         logging.warning("No current course or not in sections map")
         return
 
-    if not course_sections_map[curr_course]:
+    # keep the reference instead of re-indexing the map for every use
+    sections = course_sections_map[curr_course]
+
+    if not sections:
         logging.warning(
             f"No sections found to add additional time for course: {curr_course}"
         )
         return
 
-    prev_section = course_sections_map[curr_course][-1]
+    prev_section = sections[-1]
     if "meeting_times" not in prev_section or prev_section["meeting_times"] is None:
         prev_section["meeting_times"] = []
 
@@ -332,7 +430,7 @@ def process_subject_rows(rows: list[Tag]) -> CourseMap:
     Returns:
         CourseMap: Dictionary mapping course codes to lists of section objects
     """
-    course_sections_map = defaultdict(list)
+    course_sections_map: CourseMap = {}
     curr_course = None
 
     for i, row in enumerate(rows):
@@ -340,7 +438,8 @@ def process_subject_rows(rows: list[Tag]) -> CourseMap:
             logging.warning(f"Row {i}: Invalid row type, skipping")
             continue
 
-        cols = row.find_all("td")
+        # cells are direct children of the row, no need for a recursive search
+        cols = row.find_all("td", recursive=False)
         if not cols:
             logging.warning(f"Row {i}: No columns found, skipping")
             continue
@@ -348,53 +447,34 @@ def process_subject_rows(rows: list[Tag]) -> CourseMap:
         col_count = len(cols)
         logging.info(f"Row {i}: Processing row with {col_count} columns")
 
-        if col_count == 9 and is_additional_times_row(cols, 9):
-            logging.info("Scraping Additional Time row (Online)")
-
-            parse_additional_times_row(
-                cols, course_sections_map, curr_course, is_online=True
+        is_online = ADDITIONAL_TIMES_ROW_TYPES.get(col_count)
+        if is_online is not None and is_additional_times_row(cols, col_count):
+            logging.info(
+                f"Scraping Additional Time row ({'Online' if is_online else 'In Person'})"
             )
-            # we don't want to create a new section here
-            continue
-
-        elif col_count == 10 and is_additional_times_row(cols, 10):
-            logging.info("Scraping Additional Time row (In Person)")
             parse_additional_times_row(
-                cols, course_sections_map, curr_course, is_online=False
+                cols, course_sections_map, curr_course, is_online=is_online
             )
             # we don't want to create a new section here
             continue
 
-        parsed_data = None
-        meeting_times = None
-
-        # This is things like online async classes, research, independent study, internship, etc
-        # All should be 'ARR' for times
-        if col_count == 12:
-            parsed_data = parse_new_section_data(cols, "arranged")
-            if parsed_data:
-                meeting_times = determine_meeting_times(
-                    parsed_data.get("days"),
-                    parsed_data.get("time"),
-                )
-
-        # Regular in person classes or sync online classes
-        elif col_count == 13:
-            parsed_data = parse_new_section_data(cols, "regular")
-            if parsed_data:
-                meeting_times = determine_meeting_times(
-                    parsed_data.get("days"),
-                    parsed_data.get("begin_time"),
-                    parsed_data.get("end_time"),
-                )
-
-        # unrecognized row type
-        else:
+        row_type = SECTION_ROW_TYPES.get(col_count)
+        if row_type is None:
             logging.debug(
                 f"Row {i}: Unrecognized row type with {col_count} columns, skipping"
             )
             continue
 
+        parsed_data = parse_new_section_data(cols, row_type)
+        meeting_times = None
+        if parsed_data:
+            # arranged rows only have a single "time" column
+            meeting_times = determine_meeting_times(
+                parsed_data.get("days"),
+                parsed_data.get("begin_time", parsed_data.get("time")),
+                parsed_data.get("end_time"),
+            )
+
         if not parsed_data:
             logging.warning(f"Row {i}: Failed to parse section data, skipping")
             continue
@@ -407,13 +487,62 @@ def process_subject_rows(rows: list[Tag]) -> CourseMap:
         curr_course = course
         section = create_section_object(parsed_data, meeting_times)
         if section:
-            course_sections_map[curr_course].append(section)
+            course_sections_map.setdefault(curr_course, []).append(section)
         else:
             logging.warning(f"Row {i}: Failed to create section object")
 
     return course_sections_map
 
 
+def index_sections_by_crn(subjects_map: SubjectMap) -> dict[str, dict[str, Any]]:
+    """Build a lookup table from CRN to the section it identifies.
+
+    Args:
+        subjects_map (SubjectMap): Scraped subjects, as returned by
+            TimetableScraper.scrape_all_subjects()
+
+    Returns:
+        dict[str, dict[str, Any]]: Maps each CRN to a dictionary with the
+            "subject", "course", and "section" it belongs to. The first section
+            seen wins if a CRN appears more than once.
+    """
+    crn_index: dict[str, dict[str, Any]] = {}
+    for subject, course_map in subjects_map.items():
+        for course, sections in course_map.items():
+            for section in sections:
+                crn = section.get("crn")
+                if crn and crn not in crn_index:
+                    crn_index[crn] = {
+                        "subject": subject,
+                        "course": course,
+                        "section": section,
+                    }
+    return crn_index
+
+
+def index_courses(
+    subjects_map: SubjectMap,
+) -> dict[str, list[tuple[str, str, list[SectionData]]]]:
+    """Build a case-insensitive lookup table of course codes.
+
+    Args:
+        subjects_map (SubjectMap): Scraped subjects, as returned by
+            TimetableScraper.scrape_all_subjects()
+
+    Returns:
+        dict[str, list[tuple[str, str, list[SectionData]]]]: Maps each upper-cased
+            course code to the (subject, course, sections) entries that offer it,
+            in scrape order.
+    """
+    course_index: dict[str, list[tuple[str, str, list[SectionData]]]] = {}
+    for subject, course_map in subjects_map.items():
+        for course, sections in course_map.items():
+            course_index.setdefault(course.upper(), []).append(
+                (subject, course, sections)
+            )
+    return course_index
+
+
 # ===========================================================================
 # High Level Scraping (depend on row processing functions)
 # ===========================================================================
@@ -430,27 +559,66 @@ class TimetableScraper:
         term (str): The academic term to scrape (e.g., "202409").
         fetcher (TimetableFetcher): An instance of TimetableFetcher to handle
                                     HTTP requests.
+        max_workers (int): Maximum number of subjects scraped concurrently.
+        subject_script_pattern (re.Pattern[str]): Pattern matching this term's
+                                    case in the subject dropdown script.
+        subjects (Optional[list[str]]): Subject codes cached by the first
+                                    successful get_subjects() call.
+        subjects_map (Optional[SubjectMap]): Full scrape of every subject, cached
+                                    by the first get_subjects_map() call in
+                                    which no subject failed to scrape.
+        course_index (Optional[dict[str, list[tuple[str, str, list[SectionData]]]]]):
+                                    Course lookup table built from subjects_map
+                                    on the first find_course() call.
+        crn_index (Optional[dict[str, dict[str, Any]]]): CRN lookup table built
+                                    from subjects_map on the first
+                                    find_section_by_crn() call.
     """
 
-    def __init__(self, term: str) -> None:
+    def __init__(self, term: str, max_workers: int = MAX_WORKERS) -> None:
         """Initializes the TimetableScraper for a specific term.
 
         Args:
             term (str): The academic term to scrape (e.g., "202409").
+            max_workers (int): Maximum number of subjects scraped concurrently.
+                               Use 1 to scrape subjects one at a time.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
         self.term: str = term
-        self.fetcher: TimetableFetcher = TimetableFetcher(term)
+        self.max_workers: int = max_workers
+        # one pooled connection per worker, so none are discarded under load
+        self.fetcher: TimetableFetcher = TimetableFetcher(term, pool_size=max_workers)
+        # subject codes for the term, cached by get_subjects()
+        self.subjects: Optional[list[str]] = None
+        # full scrape shared by the lookup indexes, see get_subjects_map()
+        self.subjects_map: Optional[SubjectMap] = None
+        # built on the first course search, see find_course()
+        self.course_index: Optional[
+            dict[str, list[tuple[str, str, list[SectionData]]]]
+        ] = None
+        # built on the first CRN lookup, see find_section_by_crn()
+        self.crn_index: Optional[dict[str, dict[str, Any]]] = None
+        # the term is fixed for the scraper's lifetime, so compile its pattern once
+        self.subject_script_pattern: re.Pattern[str] = re.compile(
+            rf'case\s+["\']?{re.escape(term)}["\']?\s*:(.*?)break;', re.DOTALL
+        )
 
     def get_subjects(self) -> list[str]:
         """Retrieves a list of all available subject codes for the term.
 
         Fetches the main timetable page and parses it to extract all unique
-        subject abbreviations (e.g., 'CS', 'MATH', 'ENGL').
+        subject abbreviations (e.g., 'CS', 'MATH', 'ENGL'). The result is cached
+        after the first successful call until close() is called.
 
         Returns:
             list[str]: A list of unique subject codes. Returns an empty list
                        if fetching or parsing fails.
         """
+        if self.subjects is not None:
+            return list(self.subjects)
+
         try:
             html = self.fetcher.fetch_html("%")
             if html is None:
@@ -460,24 +628,21 @@ class TimetableScraper:
             logging.error(f"Failed to fetch HTML when retrieving all subjects: {e}")
             return []
 
-        script_match = re.search(
-            rf'case\s+["\']?{re.escape(self.term)}["\']?\s*:(.*?)break;',
-            html,
-            re.DOTALL,
-        )
+        script_match = self.subject_script_pattern.search(html)
         if not script_match:
             logging.warning(
                 "Could not find matching script when retrieving all subjects"
             )
             return []
 
-        subjects = re.findall(
-            r'new Option\(".*?",\s*"([A-Z0-9]+)"', script_match.group(1)
-        )
-        unique_subjects = list(dict.fromkeys(subjects))
+        subjects = SUBJECT_OPTION_PATTERN.findall(script_match.group(1))
+        # subject codes are reused as keys and payload values on every scrape
+        unique_subjects = [sys.intern(code) for code in dict.fromkeys(subjects)]
         logging.info(f"Found {len(unique_subjects)} subjects for term {self.term}")
 
-        return unique_subjects
+        if unique_subjects:
+            self.subjects = unique_subjects
+        return list(unique_subjects)
 
     def scrape_subject(self, subject: str) -> CourseMap:
         """Scrapes all course data for a single subject.
@@ -492,23 +657,37 @@ class TimetableScraper:
             CourseMap: A dictionary mapping course codes to a list of their
                        section data. Returns an empty dictionary if the scrape fails.
         """
+        course_sections_map = self.try_scrape_subject(subject)
+        return course_sections_map if course_sections_map is not None else {}
+
+    def try_scrape_subject(self, subject: str) -> Optional[CourseMap]:
+        """Scrapes a single subject, telling failed scrapes apart from empty ones.
+
+        Args:
+            subject (str): The subject code to scrape (e.g., 'CS').
+
+        Returns:
+            Optional[CourseMap]: The subject's courses mapped to their sections,
+                                 an empty dictionary if the subject has no
+                                 sections, or None if fetching or parsing failed.
+        """
         logging.info(f"Starting scrape for subject: {subject}")
 
         try:
             html = self.fetcher.fetch_html(subject)
             if html is None:
                 logging.warning(f"No HTML returned for subject: {subject}")
-                return {}
+                return None
         except Exception as e:
             logging.error(f"Failed to fetch HTML for subject {subject}: {e}")
-            return {}
+            return None
 
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml", parse_only=SECTION_TABLE_STRAINER)
             section_table = soup.find("table", class_="dataentrytable")
         except Exception as e:
             logging.error(f"Failed to parse HTML for subject {subject}: {e}")
-            return {}
+            return None
 
         if not isinstance(section_table, Tag) or section_table is None:
             logging.debug(f"No section table found for subject: {subject}")
@@ -528,8 +707,8 @@ class TimetableScraper:
     def scrape_multiple_subjects(self, subjects: list[str]) -> SubjectMap:
         """Scrapes course data for a list of subjects.
 
-        Iterates through a list of subject codes and scrapes the data for each one,
-        aggregating the results into a single map.
+        Scrapes the data for each subject code concurrently, aggregating the
+        results into a single map in the order the subjects were given.
 
         Args:
             subjects (list[str]): A list of subject codes to scrape.
@@ -538,14 +717,37 @@ class TimetableScraper:
             SubjectMap: A dictionary mapping each subject code to its corresponding
                         CourseMap.
         """
+        all_subjects_map, _ = self.try_scrape_subjects(subjects)
+        return all_subjects_map
+
+    def try_scrape_subjects(self, subjects: list[str]) -> tuple[SubjectMap, list[str]]:
+        """Scrapes a list of subjects concurrently and reports which ones failed.
+
+        Args:
+            subjects (list[str]): A list of subject codes to scrape.
+
+        Returns:
+            tuple[SubjectMap, list[str]]: The subjects that have sections mapped
+                                          to their CourseMaps, in the order given,
+                                          and the subjects whose scrape failed.
+        """
         all_subjects_map: SubjectMap = {}
+        failed_subjects: list[str] = []
+        if not subjects:
+            return all_subjects_map, failed_subjects
 
-        for subject in subjects:
-            course_sections_map = self.scrape_subject(subject)
-            if course_sections_map:  # Only add if we got data
-                all_subjects_map[subject] = course_sections_map
+        # each scrape is dominated by waiting on the timetable server, so overlap
+        # the requests. map() yields results in the same order as subjects.
+        max_workers = min(self.max_workers, len(subjects))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            course_sections_maps = executor.map(self.try_scrape_subject, subjects)
+            for subject, course_sections_map in zip(subjects, course_sections_maps):
+                if course_sections_map is None:
+                    failed_subjects.append(subject)
+                elif course_sections_map:  # Only add if we got data
+                    all_subjects_map[subject] = course_sections_map
 
-        return all_subjects_map
+        return all_subjects_map, failed_subjects
 
     def scrape_all_subjects(self) -> SubjectMap:
         """Scrapes course data for all available subjects in the term.
@@ -564,11 +766,41 @@ class TimetableScraper:
         logging.info(f"Found {len(subjects)} subjects to process")
         return self.scrape_multiple_subjects(subjects)
 
+    def get_subjects_map(self) -> SubjectMap:
+        """Scrapes every subject in the term once and caches the result.
+
+        The cached map backs both find_course() and find_section_by_crn(), so
+        using both only fetches each subject once. A scrape in which any subject
+        failed is returned but not cached, so the next call scrapes again rather
+        than hiding that subject's sections until close().
+
+        Returns:
+            SubjectMap: A map of all subjects and their courses for the term.
+        """
+        if self.subjects_map is not None:
+            return self.subjects_map
+
+        subjects = self.get_subjects()
+        if not subjects:
+            logging.error(f"No subjects found for term: {self.term}")
+            return {}
+
+        subjects_map, failed_subjects = self.try_scrape_subjects(subjects)
+        if failed_subjects:
+            logging.warning(
+                f"Not caching scrape, failed to scrape subjects: {failed_subjects}"
+            )
+        else:
+            self.subjects_map = subjects_map
+        return subjects_map
+
     def find_course(self, course_code: str) -> dict[str, CourseMap]:
         """Finds a specific course by its code across all subjects.
 
         This method is useful for searching for a course when the subject is
-        unknown (e.g., cross-listed courses).
+        unknown (e.g., cross-listed courses). The first search indexes the courses
+        from get_subjects_map(); later searches reuse that index without fetching
+        anything. Call close() to discard the index.
 
         Args:
             course_code (str): The course code to search for (e.g., "CS 1114").
@@ -576,26 +808,33 @@ class TimetableScraper:
         Returns:
             dict[str, CourseMap]: A dictionary where keys are subject codes
                                   that contain the course, and values are CourseMaps
-                                  filtered to only that course.
+                                  filtered to only that course. The section lists
+                                  are copies and safe to modify.
         """
-        subjects = self.get_subjects()
-        results = {}
-
-        for subject in subjects:
-            course_map = self.scrape_subject(subject)
-            for course, sections in course_map.items():
-                if course_code.upper() in course.upper():
-                    if subject not in results:
-                        results[subject] = {}
-                    results[subject][course] = sections
+        course_index = self.course_index
+        if course_index is None:
+            course_index = index_courses(self.get_subjects_map())
+            # only index a complete scrape, see get_subjects_map()
+            if self.subjects_map is not None:
+                self.course_index = course_index
+
+        query = course_code.upper()
+        results: dict[str, CourseMap] = {}
+
+        for course_upper, entries in course_index.items():
+            if query in course_upper:
+                for subject, course, sections in entries:
+                    # copy so callers editing the result can't change the index
+                    results.setdefault(subject, {})[course] = copy.deepcopy(sections)
 
         return results
 
     def find_section_by_crn(self, crn: str) -> Optional[dict[str, Any]]:
         """Finds a specific course section by its CRN across all subjects.
 
-        Scans all subjects and courses to find the single section that matches
-        the given Course Registration Number (CRN).
+        The first lookup indexes all sections from get_subjects_map() by CRN;
+        later lookups are answered from that index without fetching anything.
+        Call close() to discard the index.
 
         Args:
             crn (str): The 5-digit CRN of the section to find.
@@ -603,20 +842,18 @@ class TimetableScraper:
         Returns:
             Optional[dict[str, Any]]: A dictionary containing the subject, course,
                                       and section data if found, otherwise None.
+                                      The result is a copy and safe to modify.
         """
-        subjects = self.get_subjects()
+        crn_index = self.crn_index
+        if crn_index is None:
+            crn_index = index_sections_by_crn(self.get_subjects_map())
+            # only index a complete scrape, see get_subjects_map()
+            if self.subjects_map is not None:
+                self.crn_index = crn_index
 
-        for subject in subjects:
-            course_map = self.scrape_subject(subject)
-            for course, sections in course_map.items():
-                for section in sections:
-                    if section.get("crn") == crn:
-                        return {
-                            "subject": subject,
-                            "course": course,
-                            "section": section,
-                        }
-        return None
+        entry = crn_index.get(crn)
+        # copy so callers editing the result can't change the cached index
+        return copy.deepcopy(entry) if entry is not None else None
 
     def get_courses_for_subject(self, subject: str) -> list[str]:
         """Get the list of courses available for the specified subject.
@@ -656,8 +893,7 @@ class TimetableScraper:
                         "SUBJECT-####" format.
         """
         # course = "CS-2114"
-        course_pattern = re.compile(r"^[A-Za-z]+-\d{4}$")
-        if not course_pattern.match(course):
+        if not COURSE_PATTERN.match(course):
             raise ValueError(
                 f"Invalid course format: '{course}'. Expected format like 'CS-2114'."
             )
@@ -666,12 +902,18 @@ class TimetableScraper:
         subject_all_caps = subject.upper()
         courses = self.scrape_subject(subject_all_caps)
         course_formatted = subject_all_caps + "-" + course_num
-        course_sections = courses[course_formatted]
+        course_sections = courses.get(course_formatted, [])
         return course_sections
 
     def close(self):
         """Closes the underlying HTTP session.
 
         It's important to call this method when done to release resources.
+        Also discards the cached subjects, the full scrape, and the course and
+        CRN indexes.
         """
+        self.subjects = None
+        self.subjects_map = None
+        self.course_index = None
+        self.crn_index = None
         self.fetcher.close_session()
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from requests.exceptions import RequestException, HTTPError, Timeout, ConnectionError
 from scraper.timetable_fetcher import TimetableFetcher
 
@@ -9,73 +9,122 @@ class TimetableFetcherTest(unittest.TestCase):
         """Sets up the text fixture. Runs once at the beginning of each test."""
         self.term = "202509"
         self.subject = "CS"
-        self.fetcher = TimetableFetcher(self.term, self.subject)
+        self.fetcher = TimetableFetcher(self.term)
 
-    def tearDown(self):
-        return super().tearDown()
+        # replace post on this fetcher's session only, no module-level patching
+        self.mock_post = MagicMock()
+        self.fetcher.session.post = self.mock_post
 
-    @patch("scraper.timetable_fetcher.requests.post")
-    def test_fetch_html_success(self, mock_post):
-        """Tests that the fetch_html() function returns the expected HTML content.
+    def test_session_mounts_retrying_adapter(self):
+        """Tests that the session retries transient failures on https requests."""
+        adapter = self.fetcher.session.get_adapter(self.fetcher.base_url)
 
-        Args:
-            mock_post (MagicMock): A mock of the requests.post method, injected
-            by the @patch decorator to simulate an HTTP response.
-        """
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn("POST", adapter.max_retries.allowed_methods)
+
+    def test_session_pool_sized_for_concurrent_requests(self):
+        """Tests that the pool keeps one connection per concurrent request."""
+        fetcher = TimetableFetcher(self.term, pool_size=32)
+        adapter = fetcher.session.get_adapter(fetcher.base_url)
+
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+
+    def test_fetch_html_success(self):
+        """Tests that the fetch_html() function returns the expected HTML content."""
         # ===== Arrange =====
         expected_html = "<html>Test HTML</html>"
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = expected_html
-        mock_post.return_value = mock_response
+        self.mock_post.return_value = mock_response
+        self.fetcher.fix_html = MagicMock(side_effect=lambda html: html)
 
         # ===== Act ======
-        actual_html = self.fetcher.fetch_html()
+        actual_html = self.fetcher.fetch_html(self.subject)
 
         # ===== Assert =====
         self.assertEqual(actual_html, expected_html)
-        mock_post.assert_called_once_with(
-            self.fetcher.base_url, data=self.fetcher.payload, timeout=10
+        self.fetcher.fix_html.assert_called_once_with(expected_html)
+        self.mock_post.assert_called_once()
+        args, kwargs = self.mock_post.call_args
+        self.assertEqual(args, (self.fetcher.base_url,))
+        self.assertIs(
+            kwargs["data"], TimetableFetcher._build_payload(self.term, self.subject)
         )
+        self.assertEqual(kwargs["timeout"], 20)
+
+    def test_fetch_html_detects_encoding_per_response(self):
+        """Tests that an ASCII-only page does not fix the encoding for later pages."""
+        ascii_page, latin_page = MagicMock(text="a"), MagicMock(text="b")
+        ascii_page.headers = {"Content-Type": "text/html"}
+        ascii_page.apparent_encoding = "ascii"
+        latin_page.headers = {"Content-Type": "text/html"}
+        latin_page.apparent_encoding = "ISO-8859-1"
+        self.mock_post.side_effect = [ascii_page, latin_page]
+        self.fetcher.fix_html = MagicMock(side_effect=lambda html: html)
+
+        self.fetcher.fetch_html("%")
+        self.fetcher.fetch_html(self.subject)
+
+        self.assertEqual(ascii_page.encoding, "ascii")
+        self.assertEqual(latin_page.encoding, "ISO-8859-1")
+
+    def test_fetch_html_uses_declared_charset(self):
+        """Tests that a charset in the Content-Type header is not overridden."""
+        mock_response = MagicMock(text="a", encoding="utf-8")
+        mock_response.headers = {"Content-Type": "text/html; charset=UTF-8"}
+        mock_response.apparent_encoding = "ascii"
+        self.mock_post.return_value = mock_response
+        self.fetcher.fix_html = MagicMock(side_effect=lambda html: html)
+
+        self.fetcher.fetch_html(self.subject)
+
+        self.assertEqual(mock_response.encoding, "utf-8")
+
+    def test_build_payload_is_shared_per_term_and_subject(self):
+        """Tests that payloads are built once per (term, subject) and are read-only."""
+        payload = TimetableFetcher._build_payload(self.term, self.subject)
+
+        self.assertIs(payload, TimetableFetcher._build_payload(self.term, self.subject))
+        self.assertEqual(payload["TERMYEAR"], self.term)
+        self.assertEqual(payload["subj_code"], self.subject)
+        with self.assertRaises(TypeError):
+            payload["subj_code"] = "MATH"  # type: ignore
 
-    @patch("scraper.timetable_fetcher.requests.post")
-    def test_fetch_html_timeout(self, mock_post):
-        """Tests that fetch_html() raises RuntimeError on timeout."""
-        mock_post.side_effect = Timeout()
+    def test_fetch_html_timeout(self):
+        """Tests that fetch_html() logs and returns None on timeout."""
+        self.mock_post.side_effect = Timeout()
 
-        with self.assertRaises(RuntimeError) as context:
-            self.fetcher.fetch_html()
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertIsNone(self.fetcher.fetch_html(self.subject))
 
-        self.assertIn("timed out", str(context.exception).lower())
+        self.assertIn("timed out", logs.output[0].lower())
 
-    @patch("scraper.timetable_fetcher.requests.post")
-    def test_fetch_html_http_error(self, mock_post):
-        """Tests that fetch_html() raises RuntimeError on HTTP error."""
+    def test_fetch_html_http_error(self):
+        """Tests that fetch_html() logs and returns None on HTTP error."""
         mock_response = MagicMock()
         mock_response.raise_for_status.side_effect = HTTPError("404 Client Error")
-        mock_post.return_value = mock_response
+        self.mock_post.return_value = mock_response
 
-        with self.assertRaises(RuntimeError) as context:
-            self.fetcher.fetch_html()
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertIsNone(self.fetcher.fetch_html(self.subject))
 
-        self.assertIn("http error", str(context.exception).lower())
+        self.assertIn("http error", logs.output[0].lower())
 
-    @patch("scraper.timetable_fetcher.requests.post")
-    def test_fetch_html_connection_error(self, mock_post):
-        """Tests that fetch_html() raises RuntimeError on connection error."""
-        mock_post.side_effect = ConnectionError()
+    def test_fetch_html_connection_error(self):
+        """Tests that fetch_html() logs and returns None on connection error."""
+        self.mock_post.side_effect = ConnectionError()
 
-        with self.assertRaises(RuntimeError) as context:
-            self.fetcher.fetch_html()
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertIsNone(self.fetcher.fetch_html(self.subject))
 
-        self.assertIn("connection error", str(context.exception).lower())
+        self.assertIn("connection error", logs.output[0].lower())
 
-    @patch("scraper.timetable_fetcher.requests.post")
-    def test_fetch_html_generic_request_exception(self, mock_post):
-        """Tests that fetch_html() raises RuntimeError on general request exception."""
-        mock_post.side_effect = RequestException("Unexpected error")
+    def test_fetch_html_generic_request_exception(self):
+        """Tests that fetch_html() logs and returns None on general request exception."""
+        self.mock_post.side_effect = RequestException("Unexpected error")
 
-        with self.assertRaises(RuntimeError) as context:
-            self.fetcher.fetch_html()
+        with self.assertLogs(level="ERROR") as logs:
+            self.assertIsNone(self.fetcher.fetch_html(self.subject))
 
-        self.assertIn("error occurred", str(context.exception).lower())
+        self.assertIn("error occurred", logs.output[0].lower())
@@ -1,19 +1,81 @@
+import functools
 import json
 from collections import defaultdict
+from pathlib import Path
+from types import SimpleNamespace
 from typing import cast
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
 
 from scraper.timetable_fetcher import TimetableFetcher
 from scraper.timetable_scraper import (DAY_MAPPING, TimetableScraper,
                                        create_section_object,
-                                       determine_meeting_times,
+                                       determine_meeting_times, intern_text,
                                        is_additional_times_row,
                                        parse_additional_times_row,
-                                       parse_new_section_data, parse_time,
-                                       process_subject_rows, safe_extract_text)
+                                       parse_days, parse_new_section_data,
+                                       parse_time, process_subject_rows,
+                                       safe_extract_text)
+
+DATA_DIR = Path(__file__).parent / "data"
+
+# same tree builder the scraper uses
+PARSER = "lxml"
+
+# process_subject_rows only needs the rows, skip building the rest of the tree
+TR_STRAINER = SoupStrainer("tr")
+
+
+@functools.lru_cache(maxsize=None)
+def parse_rows(html):
+    """Parse the <tr> rows of an HTML fragment, once per distinct fragment.
+
+    Args:
+        html (str): HTML fragment containing table rows
+
+    Returns:
+        tuple[Tag, ...]: Parsed rows, shared between callers so never mutated
+    """
+    return tuple(BeautifulSoup(html, PARSER, parse_only=TR_STRAINER).find_all("tr"))
+
+
+@functools.lru_cache(maxsize=None)
+def parse_cols(html):
+    """Parse the <td> cells of the first row in an HTML fragment, once per fragment.
+
+    Args:
+        html (str): HTML fragment containing a table row
+
+    Returns:
+        tuple[Tag, ...]: Parsed cells, shared between callers so never mutated
+    """
+    return tuple(BeautifulSoup(html, PARSER).find("tr").find_all("td"))  # type: ignore
+
+
+def assert_warned(mock_logging, message):
+    """Assert that a mocked logging module recorded the given warning.
+
+    Args:
+        mock_logging (MagicMock): Mock standing in for the logging module
+        message (str): Expected warning message
+    """
+    assert any(
+        call.args == (message,) for call in mock_logging.warning.call_args_list
+    )
+
+
+def assert_single_warning(mock_logging, message):
+    """Assert that a mocked logging module recorded exactly one warning.
+
+    Args:
+        mock_logging (MagicMock): Mock standing in for the logging module
+        message (str): Expected warning message
+    """
+    assert mock_logging.warning.call_count == 1
+    assert mock_logging.warning.call_args.args == (message,)
+    assert not mock_logging.warning.call_args.kwargs
 
 
 @pytest.fixture
@@ -94,6 +156,9 @@ class TestParseTime:
             ("01:30PM", "13:30"),
             ("12:00AM", "00:00"),
             ("11:59PM", "23:59"),
+            ("9:30AM", "09:30"),
+            ("12:30AM", "00:30"),
+            ("12:45PM", "12:45"),
             ("----- (ARR) -----", "ARR"),
             (None, "ARR"),
             ("", "ARR"),
@@ -102,6 +167,38 @@ class TestParseTime:
     def test_parse_time_formats(self, input_time, expected):
         assert parse_time(input_time) == expected
 
+    def test_parse_time_is_memoized(self):
+        parse_time.cache_clear()
+
+        parse_time("10:20AM")
+        parse_time("10:20AM")
+
+        assert parse_time.cache_info().hits == 1
+
+
+class TestParseDays:
+    """Tests day abbreviation parsing helper function"""
+
+    @pytest.mark.parametrize(
+        "days,expected",
+        [
+            ("M", (1,)),
+            ("T R", (2, 4)),
+            ("M W F", (1, 3, 5)),
+            ("S U", (6, 7)),
+        ],
+    )
+    def test_parse_days_formats(self, days, expected):
+        assert parse_days(days) == expected
+
+    def test_parse_days_is_memoized(self):
+        parse_days.cache_clear()
+
+        parse_days("M W F")
+        parse_days("M W F")
+
+        assert parse_days.cache_info().hits == 1
+
 
 class TestSafeExtractText:
     """Tests SAFE text extract from HTTML table elements helper function"""
@@ -112,10 +209,22 @@ class TestSafeExtractText:
     def test_safe_extract_not_tag_type(self):
         assert safe_extract_text(element="not a tag") is None  # type: ignore
 
+    def test_safe_extract_not_tag_type_with_selector(self):
+        assert safe_extract_text(element="not a tag", selector="b") is None  # type: ignore
+
+    def test_safe_extract_navigable_string(self):
+        """Test that a bare text node is rejected with or without a selector"""
+        td = BeautifulSoup("<td> CLMS 170 </td>", PARSER).td
+        text_node = td.string  # type: ignore
+        assert isinstance(text_node, NavigableString)
+
+        assert safe_extract_text(text_node) is None  # type: ignore
+        assert safe_extract_text(text_node, selector="b") is None  # type: ignore
+
     def test_safe_extract_no_selector(self):
         # Arrange
         html = '<td class="deleft" style="background-color:WHITE">Softw Des &amp; Data Structures</td>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, PARSER)
         td_tag = soup.find("td")
 
         # Act
@@ -127,7 +236,7 @@ class TestSafeExtractText:
     def test_safe_extract_with_selector(self):
         # Arrange
         html = '<td class="deleft" style="background-color:WHITE"><font size="1">CS-2114</font></td>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, PARSER)
         td_tag = soup.find("td")
 
         # Act
@@ -139,7 +248,7 @@ class TestSafeExtractText:
     def test_safe_extract_selector_not_found(self):
         # Arrange
         html = '<td class="deleft" style="background-color:WHITE"><font size="1">CS-2114</font></td>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, PARSER)
         td_tag = soup.find("td")
 
         # Act
@@ -149,6 +258,45 @@ class TestSafeExtractText:
         assert extracted_text is None
 
 
+class TestInternText:
+    """Tests helper function that interns repeated cell values"""
+
+    def test_intern_text_shares_equal_values(self):
+        """Test that equal values built separately become the same object"""
+        first = "".join(["Face-", "to-Face"])
+        second = "".join(["Face-to-", "Face"])
+        assert first is not second
+        assert intern_text(first) is intern_text(second)
+
+    def test_intern_text_none(self):
+        """Test that a missing value stays None"""
+        assert intern_text(None) is None
+
+
+def make_col(b_text=None):
+    """Build a lightweight stand-in for a <td> Tag.
+
+    Args:
+        b_text (Optional[str]): Text of the <b> element in the cell, or None if
+            the cell has no <b> element
+
+    Returns:
+        SimpleNamespace: Object exposing the find() method used on table cells
+    """
+    b_element = (
+        None
+        if b_text is None
+        else SimpleNamespace(get_text=lambda *args, **kwargs: b_text)
+    )
+    return SimpleNamespace(find=lambda *args, **kwargs: b_element)
+
+
+@pytest.fixture(scope="module")
+def blank_cols():
+    """Thirteen marker-less cells, built once; tests copy before replacing slots."""
+    return tuple(make_col() for _ in range(13))
+
+
 class TestIsAdditionalTimesRow:
     """Tests helper function that checks if input row is an additional times row"""
 
@@ -156,37 +304,32 @@ class TestIsAdditionalTimesRow:
         """Test with empty list"""
         assert is_additional_times_row([], 13) is False
 
-    def test_is_additional_times_row_wrong_length(self):
+    def test_is_additional_times_row_wrong_length(self, blank_cols):
         """Test with wrong expected length"""
-        cols = [Mock() for _ in range(10)]
+        cols = list(blank_cols[:10])
         assert is_additional_times_row(cols, 13) is False  # type: ignore
 
-    def test_is_additional_times_row_none_col_four(self):
+    def test_is_additional_times_row_none_col_four(self, blank_cols):
         """Tests when column 4 is None"""
-        cols = [Mock() for _ in range(13)]
+        cols = list(blank_cols)
         cols[4] = None  # type: ignore
         assert is_additional_times_row(cols, 13) is False  # type: ignore
 
-    def test_is_additional_times_row_no_b_element(self):
+    def test_is_additional_times_row_no_b_element(self, blank_cols):
         """Tests when column 4 has no <b> element"""
-        cols = [Mock() for _ in range(13)]
-        cols[4].find.return_value = None
+        cols = list(blank_cols)
         assert is_additional_times_row(cols, 13) is False  # type: ignore
 
-    def test_is_additional_times_row_wrong_text(self):
+    def test_is_additional_times_row_wrong_text(self, blank_cols):
         """Tests when <b> element has wrong text"""
-        cols = [Mock() for _ in range(13)]
-        b_mock = Mock()
-        b_mock.get_text.return_value = "Some Other Text"
-        cols[4].find.return_value = b_mock
+        cols = list(blank_cols)
+        cols[4] = make_col("Some Other Text")
         assert is_additional_times_row(cols, 13) is False  # type: ignore
 
-    def test_is_additional_times_row_correct_marker(self):
+    def test_is_additional_times_row_correct_marker(self, blank_cols):
         """Test when row has correct additional times marker"""
-        cols = [Mock() for _ in range(13)]
-        b_mock = Mock()
-        b_mock.get_text.return_value = "* Additional Times *"
-        cols[4].find.return_value = b_mock
+        cols = list(blank_cols)
+        cols[4] = make_col("* Additional Times *")
         assert is_additional_times_row(cols, 13) is True  # type: ignore
 
 
@@ -212,8 +355,7 @@ class TestParseNewSectionData:
             <td><a>CTE</a></td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        cols = soup.find("tr").find_all("td")  # type: ignore
+        cols = parse_cols(html)
 
         # Act
         result = parse_new_section_data(cols, "arranged")  # type: ignore
@@ -255,8 +397,7 @@ class TestParseNewSectionData:
             <td><a>CTE</a></td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        cols = soup.find("tr").find_all("td")  # type: ignore
+        cols = parse_cols(html)
 
         # Act
         result = parse_new_section_data(cols, "regular")  # type: ignore
@@ -283,8 +424,7 @@ class TestParseNewSectionData:
         """Test parsing with invalid row type returns empty dict"""
         # Arrange
         html = "<tr><td>test</td></tr>"
-        soup = BeautifulSoup(html, "html.parser")
-        cols = soup.find("tr").find_all("td")  # type:ignore
+        cols = parse_cols(html)
 
         # Act
         result = parse_new_section_data(cols, "invalid_type")  # type: ignore
@@ -312,8 +452,7 @@ class TestParseNewSectionData:
             <td><a></a></td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        cols = soup.find("tr").find_all("td")  # type: ignore
+        cols = parse_cols(html)
 
         # Act
         result = parse_new_section_data(cols, "regular")  # type: ignore
@@ -341,8 +480,7 @@ class TestParseNewSectionData:
             <td>CTE</td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        cols = soup.find("tr").find_all("td")  # type: ignore
+        cols = parse_cols(html)
 
         # Act
         result = parse_new_section_data(cols, "arranged")  # type: ignore
@@ -384,8 +522,7 @@ class TestParseNewSectionData:
             <td>CTE</td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        cols = soup.find("tr").find_all("td")  # type: ignore
+        cols = parse_cols(html)
 
         # Act
         result = parse_new_section_data(cols, "regular")  # type: ignore
@@ -413,16 +550,13 @@ class TestParseNewSectionData:
         """Test that invalid row type triggers warning log"""
         # Arrange
         html = "<tr><td>test</td></tr>"
-        soup = BeautifulSoup(html, "html.parser")
-        cols = soup.find("tr").find_all("td")  # type: ignore
+        cols = parse_cols(html)
 
         # Act
         parse_new_section_data(cols, "invalid_type")  # type: ignore
 
         # Assert
-        mock_logging.warning.assert_called_once_with(
-            "Row type not recognized: invalid_type"
-        )
+        assert_single_warning(mock_logging, "Row type not recognized: invalid_type")
 
     def test_parse_section_data_with_special_characters(self):
         """Test parsing section data with HTML entities and special characters"""
@@ -444,8 +578,7 @@ class TestParseNewSectionData:
             <td><a>FTE</a></td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        cols = soup.find("tr").find_all("td")  # type: ignore
+        cols = parse_cols(html)
 
         # Act
         result = parse_new_section_data(cols, "regular")  # type: ignore
@@ -683,9 +816,7 @@ class TestCreateSectionObject:
 
 
 class TestParseAdditionalTimesRow:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        html = """
+    html = """
         <tr>
         <td class="dedefault" style="border-right-width:0px;border-top-width:1px;">&nbsp;</td>
         <td class="dedefault" style="border-right-width:0px;border-top-width:1px;">&nbsp;</td>
@@ -699,8 +830,12 @@ class TestParseAdditionalTimesRow:
         <td class="dedefault" style="border-top-width:0px;background-color:WHITE">&nbsp;</td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
-        self.cols = cast(list[Tag], soup.find("tr").find_all("td"))  # type: ignore
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        # the row is parsed once and shared; only the sections map is rebuilt
+        # per test since parse_additional_times_row mutates it
+        self.cols = cast(list[Tag], parse_cols(self.html))
 
         self.course_sections_map = {
             "CS-2114": [
@@ -742,9 +877,7 @@ class TestParseAdditionalTimesRow:
         )
 
         # Assert
-        mock_logging.warning.assert_called_once_with(
-            "No current course or not in sections map"
-        )
+        assert_single_warning(mock_logging, "No current course or not in sections map")
 
     @patch("scraper.timetable_scraper.logging")
     def test_parse_additional_times_row_curr_course_not_found(self, mock_logging):
@@ -762,9 +895,7 @@ class TestParseAdditionalTimesRow:
         )
 
         # Assert
-        mock_logging.warning.assert_called_once_with(
-            "No current course or not in sections map"
-        )
+        assert_single_warning(mock_logging, "No current course or not in sections map")
 
     @patch("scraper.timetable_scraper.logging")
     def test_parse_additional_times_row_null_course_sections_map(self, mock_logging):
@@ -782,8 +913,8 @@ class TestParseAdditionalTimesRow:
         )
 
         # Assert
-        mock_logging.warning.assert_called_once_with(
-            "No sections found to add additional time for course: CS-2114"
+        assert_single_warning(
+            mock_logging, "No sections found to add additional time for course: CS-2114"
         )
 
     def test_parse_additional_times_row_no_meeting_times(self):
@@ -899,7 +1030,7 @@ class TestParseAdditionalTimesRow:
         <td class="dedefault" style="border-top-width:0px;background-color:WHITE">&nbsp;</td>
         </tr>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, PARSER)
         online_cols = cast(list[Tag], soup.find("tr").find_all("td"))  # type: ignore
         is_online = True
         curr_course = "ALCE-3624"
@@ -919,48 +1050,88 @@ class TestParseAdditionalTimesRow:
 
 
 class TestProcessSubjectRows:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Set up a variety of table rows to test the process_subject_rows function."""
-        # A standard in-person course section (13 cols)
-        self.regular_row_html = """
-        <tr>
-            <td><b>83488</b></td><td><font>CS-2114</font></td><td>Softw Des & Data Structures</td>
-            <td>L</td><td><p>Face-to-Face</p></td><td>3</td><td>35</td><td>N/A</td>
-            <td>T R</td><td>9:30AM</td><td>10:20AM</td><td>GOODW 190</td><td><a>CTE</a></td>
-        </tr>
+    """Tests process_subject_rows over a variety of table rows."""
+
+    # A standard in-person course section (13 cols)
+    regular_row_html = """
+    <tr>
+        <td><b>83488</b></td><td><font>CS-2114</font></td><td>Softw Des & Data Structures</td>
+        <td>L</td><td><p>Face-to-Face</p></td><td>3</td><td>35</td><td>N/A</td>
+        <td>T R</td><td>9:30AM</td><td>10:20AM</td><td>GOODW 190</td><td><a>CTE</a></td>
+    </tr>
+    """
+    # An online/arranged course section (12 cols)
+    arranged_row_html = """
+    <tr>
+        <td><b>12345</b></td><td><font>CS-1064</font></td><td>Intro to Programming</td>
+        <td>L</td><td><p>Online</p></td><td>3</td><td>100</td><td>John Doe</td>
+        <td>(ARR)</td><td>-----</td><td>Online</td><td><a>CTE</a></td>
+    </tr>
+    """
+    # An additional time row for an in-person course (10 cols)
+    additional_time_in_person_html = """
+    <tr>
+        <td>&nbsp;</td><td>&nbsp;</td><td>&nbsp;</td><td>&nbsp;</td>
+        <td colspan="4"><b>* Additional Times *</b></td>
+        <td>F</td><td>12:20PM</td><td>2:50PM</td><td>CLMS 170</td><td>&nbsp;</td>
+    </tr>
+    """
+    # An additional time row for an online course (9 cols)
+    additional_time_online_html = """
+    <tr>
+        <td>&nbsp;</td><td>&nbsp;</td><td>&nbsp;</td><td>&nbsp;</td>
+        <td colspan="4"><b>* Additional Times *</b></td>
+        <td>(ARR)</td><td colspan="2">----- (ARR) -----</td><td>ONLINE</td><td>&nbsp;</td>
+    </tr>
+    """
+    # A regular section (13 direct cols) whose modality cell holds a nested table,
+    # so a recursive <td> search would count 15 cells
+    nested_cell_row_html = """
+    <tr>
+        <td><b>83488</b></td><td><font>CS-2114</font></td><td>Softw Des & Data Structures</td>
+        <td>L</td><td><p>Face-to-Face</p><table><tr><td>Comment</td><td>Lab required</td></tr></table></td>
+        <td>3</td><td>35</td><td>N/A</td>
+        <td>T R</td><td>9:30AM</td><td>10:20AM</td><td>GOODW 190</td><td><a>CTE</a></td>
+    </tr>
+    """
+    # An invalid row with not enough columns
+    invalid_row_html = "<tr><td>Invalid</td></tr>"
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def parsed_rows(cls):
+        """Parse each row fixture once for the whole class.
+
+        process_subject_rows only reads the rows, so the parsed Tags are safe to
+        share and sequences of rows can be built by concatenating these tuples.
+        Tests that add rows build a list first.
         """
-        # An online/arranged course section (12 cols)
-        self.arranged_row_html = """
-        <tr>
-            <td><b>12345</b></td><td><font>CS-1064</font></td><td>Intro to Programming</td>
-            <td>L</td><td><p>Online</p></td><td>3</td><td>100</td><td>John Doe</td>
-            <td>(ARR)</td><td>-----</td><td>Online</td><td><a>CTE</a></td>
-        </tr>
-        """
-        # An additional time row for an in-person course (10 cols)
-        self.additional_time_in_person_html = """
-        <tr>
-            <td>&nbsp;</td><td>&nbsp;</td><td>&nbsp;</td><td>&nbsp;</td>
-            <td colspan="4"><b>* Additional Times *</b></td>
-            <td>F</td><td>12:20PM</td><td>2:50PM</td><td>CLMS 170</td><td>&nbsp;</td>
-        </tr>
-        """
-        # An additional time row for an online course (9 cols)
-        self.additional_time_online_html = """
-        <tr>
-            <td>&nbsp;</td><td>&nbsp;</td><td>&nbsp;</td><td>&nbsp;</td>
-            <td colspan="4"><b>* Additional Times *</b></td>
-            <td>(ARR)</td><td colspan="2">----- (ARR) -----</td><td>ONLINE</td><td>&nbsp;</td>
-        </tr>
-        """
-        # An invalid row with not enough columns
-        self.invalid_row_html = "<tr><td>Invalid</td></tr>"
-
-    def test_process_single_regular_row(self):
+        fragments = {
+            "regular": cls.regular_row_html,
+            "arranged": cls.arranged_row_html,
+            "additional_in_person": cls.additional_time_in_person_html,
+            "additional_online": cls.additional_time_online_html,
+            "invalid": cls.invalid_row_html,
+        }
+        return {name: parse_rows(html) for name, html in fragments.items()}
+
+    @pytest.fixture
+    def mock_logging(self, monkeypatch):
+        """Replace the scraper module's logging with a MagicMock for one test."""
+        mock = MagicMock()
+        monkeypatch.setattr("scraper.timetable_scraper.logging", mock)
+        return mock
+
+    @pytest.fixture
+    def patched_parse(self, monkeypatch):
+        """Replace parse_new_section_data with a MagicMock for one test."""
+        mock = MagicMock()
+        monkeypatch.setattr("scraper.timetable_scraper.parse_new_section_data", mock)
+        return mock
+
+    def test_process_single_regular_row(self, parsed_rows):
         """Test processing a single regular course row."""
-        soup = BeautifulSoup(self.regular_row_html, "html.parser")
-        rows = soup.find_all("tr")
+        rows = parsed_rows["regular"]
         result = process_subject_rows(rows)  # type: ignore
         assert "CS-2114" in result
         assert len(result["CS-2114"]) == 1
@@ -968,62 +1139,111 @@ class TestProcessSubjectRows:
         assert section["crn"] == "83488"
         assert len(section["meeting_times"]) == 2
 
-    def test_process_single_arranged_row(self):
-        """Test processing a single arranged course row."""
-        soup = BeautifulSoup(self.arranged_row_html, "html.parser")
-        rows = soup.find_all("tr")
-        result = process_subject_rows(rows)  # type: ignore
-        assert "CS-1064" in result
-        assert len(result["CS-1064"]) == 1
-        section = result["CS-1064"][0]
-        assert section["crn"] == "12345"
-        assert section["meeting_times"] == ["ARR"]
+    def test_process_row_with_nested_cells(self):
+        """Test that a row is classified by its direct cells, not nested ones."""
+        # the first parsed row is the outer one; the nested <tr> follows it
+        outer_row = parse_rows(self.nested_cell_row_html)[0]
+        assert len(outer_row.find_all("td")) == 15
+
+        result = process_subject_rows([outer_row])
 
-    def test_process_regular_row_with_additional_in_person_time(self):
-        """Test a regular course followed by an in-person additional time."""
-        html = self.regular_row_html + self.additional_time_in_person_html
-        soup = BeautifulSoup(html, "html.parser")
-        rows = soup.find_all("tr")
-        result = process_subject_rows(rows)  # type: ignore
         assert "CS-2114" in result
         section = result["CS-2114"][0]
-        assert len(section["meeting_times"]) == 3
-        assert {"day": 5, "begin_time": "12:20", "end_time": "14:50"} in section[
-            "meeting_times"
-        ]
-
-    def test_process_arranged_row_with_additional_online_time(self):
-        """Test an arranged course followed by an online additional time."""
-        html = self.arranged_row_html + self.additional_time_online_html
-        soup = BeautifulSoup(html, "html.parser")
-        rows = soup.find_all("tr")
-        result = process_subject_rows(rows)  # type: ignore
-        assert "CS-1064" in result
-        section = result["CS-1064"][0]
-        assert section["meeting_times"] == ["ARR", "ARR"]
+        assert section["crn"] == "83488"
+        assert section["modality"] == "Face-to-Face"
+        assert section["location"] == "GOODW 190"
+        assert len(section["meeting_times"]) == 2
 
-    def test_process_multiple_courses(self):
-        """Test processing multiple different courses in sequence."""
-        html = self.regular_row_html + self.arranged_row_html
-        soup = BeautifulSoup(html, "html.parser")
-        rows = soup.find_all("tr")
+    def test_process_single_arranged_row(self, parsed_rows):
+        """Test processing a single arranged course row."""
+        rows = parsed_rows["arranged"]
         result = process_subject_rows(rows)  # type: ignore
-        assert "CS-2114" in result
         assert "CS-1064" in result
-        assert len(result["CS-2114"]) == 1
         assert len(result["CS-1064"]) == 1
+        section = result["CS-1064"][0]
+        assert section["crn"] == "12345"
+        assert section["meeting_times"] == ["ARR"]
 
-    def test_process_invalid_row(self):
-        """Test that an invalid row is skipped and does not affect output."""
-        html = self.regular_row_html + self.invalid_row_html + self.arranged_row_html
-        soup = BeautifulSoup(html, "html.parser")
-        rows = soup.find_all("tr")
+    @pytest.mark.parametrize(
+        "fragments, expected_meeting_times",
+        [
+            # regular course followed by an in-person additional time
+            (
+                ("regular", "additional_in_person"),
+                {
+                    "CS-2114": [
+                        [
+                            {"day": 2, "begin_time": "09:30", "end_time": "10:20"},
+                            {"day": 4, "begin_time": "09:30", "end_time": "10:20"},
+                            {"day": 5, "begin_time": "12:20", "end_time": "14:50"},
+                        ]
+                    ]
+                },
+            ),
+            # arranged course followed by an online additional time
+            (
+                ("arranged", "additional_online"),
+                {"CS-1064": [["ARR", "ARR"]]},
+            ),
+            # multiple different courses in sequence
+            (
+                ("regular", "arranged"),
+                {
+                    "CS-2114": [
+                        [
+                            {"day": 2, "begin_time": "09:30", "end_time": "10:20"},
+                            {"day": 4, "begin_time": "09:30", "end_time": "10:20"},
+                        ]
+                    ],
+                    "CS-1064": [["ARR"]],
+                },
+            ),
+            # an invalid row is skipped and does not affect output
+            (
+                ("regular", "invalid", "arranged"),
+                {
+                    "CS-2114": [
+                        [
+                            {"day": 2, "begin_time": "09:30", "end_time": "10:20"},
+                            {"day": 4, "begin_time": "09:30", "end_time": "10:20"},
+                        ]
+                    ],
+                    "CS-1064": [["ARR"]],
+                },
+            ),
+            # additional time before any course section is ignored
+            (
+                ("additional_in_person", "regular"),
+                {
+                    "CS-2114": [
+                        [
+                            {"day": 2, "begin_time": "09:30", "end_time": "10:20"},
+                            {"day": 4, "begin_time": "09:30", "end_time": "10:20"},
+                        ]
+                    ]
+                },
+            ),
+        ],
+        ids=[
+            "regular_with_additional_in_person_time",
+            "arranged_with_additional_online_time",
+            "multiple_courses",
+            "invalid_row",
+            "additional_time_without_previous_section",
+        ],
+    )
+    def test_process_row_sequences(
+        self, fragments, expected_meeting_times, parsed_rows
+    ):
+        """Test the sections and meeting times produced by sequences of rows."""
+        rows = [row for fragment in fragments for row in parsed_rows[fragment]]
         result = process_subject_rows(rows)  # type: ignore
-        assert "CS-2114" in result
-        assert "CS-1064" in result
-        assert len(result) == 2
+        actual_meeting_times = {
+            course: [section["meeting_times"] for section in sections]
+            for course, sections in result.items()
+        }
+        assert actual_meeting_times == expected_meeting_times
 
-    @patch("scraper.timetable_scraper.logging")
     def test_process_row_with_no_course(self, mock_logging):
         """Test a row that parses but has no course code."""
         no_course_html = """
@@ -1033,676 +1253,175 @@ class TestProcessSubjectRows:
             <td>(ARR)</td><td>-----</td><td>Online</td><td><a>CTE</a></td>
         </tr>
         """
-        soup = BeautifulSoup(no_course_html, "html.parser")
-        rows = soup.find_all("tr")
+        rows = parse_rows(no_course_html)
         result = process_subject_rows(rows)  # type: ignore
         assert not result
-        mock_logging.warning.assert_any_call(
-            "Row 0: No course found in parsed data, skipping"
-        )
+        assert_warned(mock_logging, "Row 0: No course found in parsed data, skipping")
 
     def test_process_empty_rows_list(self):
         """Test processing an empty list of rows."""
         result = process_subject_rows([])
         assert not result
 
-    def test_additional_time_without_previous_section(self):
-        """Test an additional time row appearing before any course section."""
-        html = self.additional_time_in_person_html + self.regular_row_html
-        soup = BeautifulSoup(html, "html.parser")
-        rows = soup.find_all("tr")
-        result = process_subject_rows(rows)  # type: ignore
-        # The additional time should be ignored, and the regular course processed normally.
-        assert "CS-2114" in result
-        assert len(result["CS-2114"][0]["meeting_times"]) == 2
-
-    @patch("scraper.timetable_scraper.logging")
-    def test_null_row(self, mock_logging):
-        """Test with a null row"""
-        # Arrange
-        soup = BeautifulSoup(self.regular_row_html, "html.parser")
-        rows = soup.find_all("tr")
-        rows.append(None)  # type: ignore
-
-        # Act
-        process_subject_rows(rows)  # type: ignore
-
-        # Assert
-        mock_logging.warning.assert_called_once_with(
-            "Row 1: Invalid row type, skipping"
-        )
-
-    @patch("scraper.timetable_scraper.logging")
-    def test_non_tag_row(self, mock_logging):
-        """Test a row with a non-Tag class"""
+    @pytest.mark.parametrize(
+        "invalid_row", [None, "NOT A TAG"], ids=["null_row", "non_tag_row"]
+    )
+    def test_invalid_row_type(self, invalid_row, mock_logging, parsed_rows):
+        """Test a trailing row that is null or not a Tag"""
         # Arrange
-        soup = BeautifulSoup(self.regular_row_html, "html.parser")
-        rows = soup.find_all("tr")
-        rows.append("NOT A TAG")  # type: ignore
+        rows = [*parsed_rows["regular"], invalid_row]
 
         # Act
         process_subject_rows(rows)  # type: ignore
 
         # Assert
-        mock_logging.warning.assert_called_once_with(
-            "Row 1: Invalid row type, skipping"
-        )
+        assert_single_warning(mock_logging, "Row 1: Invalid row type, skipping")
 
-    @patch("scraper.timetable_scraper.logging")
     def test_no_cols(self, mock_logging):
         """Tests a row with no cols in it"""
         # Arrange
         html = "<tr></tr>"
-        soup = BeautifulSoup(html, "html.parser")
-        rows = soup.find_all("tr")
+        rows = parse_rows(html)
 
         # Act
         result = process_subject_rows(rows)  # type: ignore
 
         # Assert
         assert not result
-        mock_logging.warning.assert_called_once_with(
-            "Row 0: No columns found, skipping"
-        )
+        assert_single_warning(mock_logging, "Row 0: No columns found, skipping")
 
-    @patch("scraper.timetable_scraper.logging")
-    @patch("scraper.timetable_scraper.parse_new_section_data")
-    def test_parse_data_failure(self, mock_parse_new_section_data, mock_logging):
+    def test_parse_data_failure(self, mock_logging, patched_parse, parsed_rows):
         """Test when parse_new_section_data returns None/falsy value."""
         # Arrange - mock parse_new_section_data to return None
-        mock_parse_new_section_data.return_value = None
+        patched_parse.return_value = None
 
-        soup = BeautifulSoup(self.regular_row_html, "html.parser")
-        rows = soup.find_all("tr")
+        rows = parsed_rows["regular"]
 
         # Act
         result = process_subject_rows(rows)  # type: ignore
 
         # Assert
         assert not result  # Should be empty since parsing failed
-        mock_logging.warning.assert_any_call(
-            "Row 0: Failed to parse section data, skipping"
-        )
+        assert_warned(mock_logging, "Row 0: Failed to parse section data, skipping")
 
-    @patch("scraper.timetable_scraper.logging")
-    @patch("scraper.timetable_scraper.create_section_object")
     def test_create_section_object_failure(
-        self, mock_create_section_object, mock_logging
+        self, mock_logging, monkeypatch, parsed_rows
     ):
         """Test when create_section_object returns None/falsy value."""
         # Arrange - mock create_section_object to return None
-        mock_create_section_object.return_value = None
+        monkeypatch.setattr(
+            "scraper.timetable_scraper.create_section_object",
+            MagicMock(return_value=None),
+        )
 
-        soup = BeautifulSoup(self.regular_row_html, "html.parser")
-        rows = soup.find_all("tr")
+        rows = parsed_rows["regular"]
 
         # Act
         result = process_subject_rows(rows)  # type: ignore
 
         # Assert
         assert not result  # Should be empty since section creation failed
-        mock_logging.warning.assert_any_call("Row 0: Failed to create section object")
+        assert_warned(mock_logging, "Row 0: Failed to create section object")
 
-    @patch("scraper.timetable_scraper.logging")
-    @patch("scraper.timetable_scraper.parse_new_section_data")
     def test_parse_data_returns_empty_dict(
-        self, mock_parse_new_section_data, mock_logging
+        self, mock_logging, patched_parse, parsed_rows
     ):
         """Test when parse_new_section_data returns an empty dict (falsy)."""
         # Arrange - mock parse_new_section_data to return empty dict
-        mock_parse_new_section_data.return_value = {}
+        patched_parse.return_value = {}
 
-        soup = BeautifulSoup(self.regular_row_html, "html.parser")
-        rows = soup.find_all("tr")
+        rows = parsed_rows["regular"]
 
         # Act
         result = process_subject_rows(rows)  # type: ignore
 
         # Assert
         assert not result
-        mock_logging.warning.assert_any_call(
-            "Row 0: Failed to parse section data, skipping"
-        )
+        assert_warned(mock_logging, "Row 0: Failed to parse section data, skipping")
+
+
+@pytest.fixture(scope="session")
+def subjects_html():
+    """Sample term dropdown script for get_subjects(), read once per session."""
+    return (DATA_DIR / "subjects_202509.html").read_text(encoding="utf-8")
 
 
 class TestTimetableScraper:
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Sets up test fixtures for the TimetableScraper tests."""
-        with patch("scraper.timetable_scraper.TimetableFetcher") as mock_fetcher_class:
-            self.term = "202509"
-            self.mock_fetcher = MagicMock(spec=TimetableFetcher)
-            mock_fetcher_class.return_value = self.mock_fetcher
+    # Sample HTML for scrape_subject('CS')
+    cs_subject_html = """
+    <table class="dataentrytable">
+        <tr><th>CRN</th><th>Course</th><th>Title</th><th>Type</th><th>Modality</th><th>Hours</th><th>Cap</th><th>Instructor</th><th>Days</th><th>Begin</th><th>End</th><th>Location</th><th>Exam</th></tr>
+        <tr>
+            <td><b>83488</b></td><td><font>CS-2114</font></td><td>Softw Des & Data Structures</td>
+            <td>L</td><td><p>Face-to-Face</p></td><td>3</td><td>35</td><td>N/A</td>
+            <td>T R</td><td>9:30AM</td><td>10:20AM</td><td>GOODW 190</td><td><a>CTE</a></td>
+        </tr>
+        <tr>
+            <td><b>12345</b></td><td><font>CS-1064</font></td><td>Intro to Programming</td>
+            <td>L</td><td><p>Online</p></td><td>3</td><td>100</td><td>John Doe</td>
+            <td>(ARR)</td><td>-----</td><td>Online</td><td><a>CTE</a></td>
+        </tr>
+    </table>
+    """
 
-            self.scraper = TimetableScraper(self.term)
+    # Sample HTML for scrape_subject('MATH')
+    math_subject_html = """
+    <table class="dataentrytable">
+        <tr><th>CRN</th><th>Course</th><th>Title</th><th>Type</th><th>Modality</th><th>Hours</th><th>Cap</th><th>Instructor</th><th>Days</th><th>Begin</th><th>End</th><th>Location</th><th>Exam</th></tr>
+        <tr>
+            <td><b>54321</b></td><td><font>MATH-1225</font></td><td>Calculus I</td>
+            <td>L</td><td><p>Face-to-Face</p></td><td>4</td><td>150</td><td>Jane Smith</td>
+            <td>M W F</td><td>11:15AM</td><td>12:05PM</td><td>MCB 110</td><td><a>CTE</a></td>
+        </tr>
+        <tr>
+            <td><b>65432</b></td><td><font>MATH-1226</font></td><td>Calculus II</td>
+            <td>L</td><td><p>Face-to-Face</p></td><td>4</td><td>120</td><td>Bob Johnson</td>
+            <td>T R</td><td>2:00PM</td><td>3:15PM</td><td>MCB 120</td><td><a>CTE</a></td>
+        </tr>
+    </table>
+    """
+
+    # Sample HTML for a subject with no courses (PHYS)
+    empty_subject_html = """
+    <table class="dataentrytable">
+        <tr><th>CRN</th><th>Course</th><th>Title</th><th>Type</th><th>Modality</th><th>Hours</th><th>Cap</th><th>Instructor</th><th>Days</th><th>Begin</th><th>End</th><th>Location</th><th>Exam</th></tr>
+    </table>
+    """
+
+    # Sample HTML for a subject that returns no table
+    no_table_html = "<html><body><p>No data found</p></body></html>"
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_fetcher_class(cls):
+        """Patches TimetableFetcher once for the whole class.
+
+        Building MagicMock(spec=TimetableFetcher) introspects the spec class, so
+        the mock is created once and only reset between tests.
+        """
+        with patch("scraper.timetable_scraper.TimetableFetcher") as mock_fetcher_class:
+            mock_fetcher_class.return_value = MagicMock(spec=TimetableFetcher)
+            yield mock_fetcher_class
 
-            # Sample HTML for get_subjects()
-            self.subjects_html = """
-            <script language="javascript" type="text/javascript">
-        function dropdownlist(listindex)
-            {
-            document.ttform.subj_code.options.length = 0;
-            switch (listindex)
-            {
-            case "202506" :
-            document.ttform.subj_code.options[0]=new Option("All Subjects","%",false, false);
-            document.ttform.subj_code.options[1]=new Option("AAEC - Agricultural and Applied Economics","AAEC",false, false);
-            document.ttform.subj_code.options[2]=new Option("ACIS - Accounting and Information Systems","ACIS",false, false);
-            document.ttform.subj_code.options[3]=new Option("ADV - Advertising","ADV",false, false);
-            document.ttform.subj_code.options[4]=new Option("AFST - Africana Studies","AFST",false, false);
-            document.ttform.subj_code.options[5]=new Option("AHRM - Apparel, Housing, and Resource Management","AHRM",false, false);
-            document.ttform.subj_code.options[6]=new Option("AINS - American Indian Studies","AINS",false, false);
-            document.ttform.subj_code.options[7]=new Option("ALCE - Agricultural, Leadership, and Community Education","ALCE",false, false);
-            document.ttform.subj_code.options[8]=new Option("ALS - Agriculture and Life Sciences","ALS",false, false);
-            document.ttform.subj_code.options[9]=new Option("AOE - Aerospace and Ocean Engineering","AOE",false, false);
-            document.ttform.subj_code.options[10]=new Option("APS - Appalachian Studies","APS",false, false);
-            document.ttform.subj_code.options[11]=new Option("APSC - Animal and Poultry Sciences","APSC",false, false);
-            document.ttform.subj_code.options[12]=new Option("ARBC - Arabic","ARBC",false, false);
-            document.ttform.subj_code.options[13]=new Option("ARCH - Architecture","ARCH",false, false);
-            document.ttform.subj_code.options[14]=new Option("ART - Art and Art History","ART",false, false);
-            document.ttform.subj_code.options[15]=new Option("ASPT - Alliance for Social, Political, Ethical, and Cultural Thought","ASPT",false, false);
-            document.ttform.subj_code.options[16]=new Option("AT - Agricultural Technology","AT",false, false);
-            document.ttform.subj_code.options[17]=new Option("BC - Building Construction","BC",false, false);
-            document.ttform.subj_code.options[18]=new Option("BCHM - Biochemistry","BCHM",false, false);
-            document.ttform.subj_code.options[19]=new Option("BIOL - Biological Sciences","BIOL",false, false);
-            document.ttform.subj_code.options[20]=new Option("BIT - Business Information Technology","BIT",false, false);
-            document.ttform.subj_code.options[21]=new Option("BMES - Biomedical Engineering and Sciences","BMES",false, false);
-            document.ttform.subj_code.options[22]=new Option("BMSP - Biomedical Sciences and Pathobiology","BMSP",false, false);
-            document.ttform.subj_code.options[23]=new Option("BMVS - Biomedical and Veterinary Sciences","BMVS",false, false);
-            document.ttform.subj_code.options[24]=new Option("BSE - Biological Systems Engineering","BSE",false, false);
-            document.ttform.subj_code.options[25]=new Option("BUS - Business","BUS",false, false);
-            document.ttform.subj_code.options[26]=new Option("CEE - Civil and Environmental Engineering","CEE",false, false);
-            document.ttform.subj_code.options[27]=new Option("CEM - Construction Engineering and Management","CEM",false, false);
-            document.ttform.subj_code.options[28]=new Option("CHE - Chemical Engineering","CHE",false, false);
-            document.ttform.subj_code.options[29]=new Option("CHEM - Chemistry","CHEM",false, false);
-            document.ttform.subj_code.options[30]=new Option("CHN - Chinese","CHN",false, false);
-            document.ttform.subj_code.options[31]=new Option("CINE - Cinema","CINE",false, false);
-            document.ttform.subj_code.options[32]=new Option("CLA - Classical Studies","CLA",false, false);
-            document.ttform.subj_code.options[33]=new Option("CMDA - Computational Modeling and Data Analytics","CMDA",false, false);
-            document.ttform.subj_code.options[34]=new Option("CMST - Communication Studies","CMST",false, false);
-            document.ttform.subj_code.options[35]=new Option("CNST - Construction","CNST",false, false);
-            document.ttform.subj_code.options[36]=new Option("COMM - Communication","COMM",false, false);
-            document.ttform.subj_code.options[37]=new Option("CONS - Consumer Studies","CONS",false, false);
-            document.ttform.subj_code.options[38]=new Option("CRIM - Criminology","CRIM",false, false);
-            document.ttform.subj_code.options[39]=new Option("CS - Computer Science","CS",false, true);
-            document.ttform.subj_code.options[40]=new Option("CSES - Crop and Soil Environmental Sciences","CSES",false, false);
-            document.ttform.subj_code.options[41]=new Option("DASC - Dairy Science","DASC",false, false);
-            document.ttform.subj_code.options[42]=new Option("ECE - Electrical and Computer Engineering","ECE",false, false);
-            document.ttform.subj_code.options[43]=new Option("ECON - Economics","ECON",false, false);
-            document.ttform.subj_code.options[44]=new Option("EDCI - Education, Curriculum and Instruction","EDCI",false, false);
-            document.ttform.subj_code.options[45]=new Option("EDCO - Counselor Education","EDCO",false, false);
-            document.ttform.subj_code.options[46]=new Option("EDCT - Career and Technical Education","EDCT",false, false);
-            document.ttform.subj_code.options[47]=new Option("EDEL - Educational Leadership","EDEL",false, false);
-            document.ttform.subj_code.options[48]=new Option("EDEP - Educational Psychology","EDEP",false, false);
-            document.ttform.subj_code.options[49]=new Option("EDHE - Higher Education","EDHE",false, false);
-            document.ttform.subj_code.options[50]=new Option("EDIT - Instructional Design and Technology","EDIT",false, false);
-            document.ttform.subj_code.options[51]=new Option("EDP - Environmental Design and Planning","EDP",false, false);
-            document.ttform.subj_code.options[52]=new Option("EDRE - Education, Research and Evaluation","EDRE",false, false);
-            document.ttform.subj_code.options[53]=new Option("ENGE - Engineering Education","ENGE",false, false);
-            document.ttform.subj_code.options[54]=new Option("ENGL - English","ENGL",false, false);
-            document.ttform.subj_code.options[55]=new Option("ENGR - Engineering","ENGR",false, false);
-            document.ttform.subj_code.options[56]=new Option("ENT - Entomology","ENT",false, false);
-            document.ttform.subj_code.options[57]=new Option("ESM - Engineering Science and Mechanics","ESM",false, false);
-            document.ttform.subj_code.options[58]=new Option("FIN - Finance","FIN",false, false);
-            document.ttform.subj_code.options[59]=new Option("FIW - Fish and Wildlife Conservation","FIW",false, false);
-            document.ttform.subj_code.options[60]=new Option("FL - Modern and Classical Languages and Literatures","FL",false, false);
-            document.ttform.subj_code.options[61]=new Option("FMD - Fashion Merchandising and Design","FMD",false, false);
-            document.ttform.subj_code.options[62]=new Option("FR - French","FR",false, false);
-            document.ttform.subj_code.options[63]=new Option("FREC - Forest Resources and Environmental Conservation","FREC",false, false);
-            document.ttform.subj_code.options[64]=new Option("FST - Food Science and Technology","FST",false, false);
-            document.ttform.subj_code.options[65]=new Option("GBCB - Genetics, Bioinformatics, Computational Biology","GBCB",false, false);
-            document.ttform.subj_code.options[66]=new Option("GEN - Invalid for Summer 2025","GEN",false, false);
-            document.ttform.subj_code.options[67]=new Option("GEOG - Geography","GEOG",false, false);
-            document.ttform.subj_code.options[68]=new Option("GEOS - Geosciences","GEOS",false, false);
-            document.ttform.subj_code.options[69]=new Option("GER - German","GER",false, false);
-            document.ttform.subj_code.options[70]=new Option("GIA - Government and International Affairs","GIA",false, false);
-            document.ttform.subj_code.options[71]=new Option("GR - Greek","GR",false, false);
-            document.ttform.subj_code.options[72]=new Option("GRAD - Graduate School","GRAD",false, false);
-            document.ttform.subj_code.options[73]=new Option("HD - Human Development","HD",false, false);
-            document.ttform.subj_code.options[74]=new Option("HIST - History","HIST",false, false);
-            document.ttform.subj_code.options[75]=new Option("HNFE - Human Nutrition, Foods and Exercise","HNFE",false, false);
-            document.ttform.subj_code.options[76]=new Option("HORT - Horticulture","HORT",false, false);
-            document.ttform.subj_code.options[77]=new Option("HTM - Hospitality and Tourism Management","HTM",false, false);
-            document.ttform.subj_code.options[78]=new Option("HUM - Humanities","HUM",false, false);
-            document.ttform.subj_code.options[79]=new Option("IDS - Industrial Design","IDS",false, false);
-            document.ttform.subj_code.options[80]=new Option("IS - International Studies","IS",false, false);
-            document.ttform.subj_code.options[81]=new Option("ISE - Industrial and Systems Engineering","ISE",false, false);
-            document.ttform.subj_code.options[82]=new Option("ITAL - Italian","ITAL",false, false);
-            document.ttform.subj_code.options[83]=new Option("ITDS - Interior Design","ITDS",false, false);
-            document.ttform.subj_code.options[84]=new Option("JMC - Journalism and Mass Communication","JMC",false, false);
-            document.ttform.subj_code.options[85]=new Option("JPN - Japanese","JPN",false, false);
-            document.ttform.subj_code.options[86]=new Option("JUD - Judaic Studies","JUD",false, false);
-            document.ttform.subj_code.options[87]=new Option("LAHS - Liberal Arts and Human Sciences","LAHS",false, false);
-            document.ttform.subj_code.options[88]=new Option("LAR - Landscape Architecture","LAR",false, false);
-            document.ttform.subj_code.options[89]=new Option("LAT - Latin","LAT",false, false);
-            document.ttform.subj_code.options[90]=new Option("LDRS - Leadership Studies","LDRS",false, false);
-            document.ttform.subj_code.options[91]=new Option("MACR - Macromolecular Science and Engineering","MACR",false, false);
-            document.ttform.subj_code.options[92]=new Option("MATH - Mathematics","MATH",false, false);
-            document.ttform.subj_code.options[93]=new Option("ME - Mechanical Engineering","ME",false, false);
-            document.ttform.subj_code.options[94]=new Option("MGT - Management","MGT",false, false);
-            document.ttform.subj_code.options[95]=new Option("MINE - Mining Engineering","MINE",false, false);
-            document.ttform.subj_code.options[96]=new Option("MKTG - Marketing","MKTG",false, false);
-            document.ttform.subj_code.options[97]=new Option("MN - Military Navy","MN",false, false);
-            document.ttform.subj_code.options[98]=new Option("MSE - Materials Science and Engineering","MSE",false, false);
-            document.ttform.subj_code.options[99]=new Option("MTRG - Meteorology","MTRG",false, false);
-            document.ttform.subj_code.options[100]=new Option("MUS - Music","MUS",false, false);
-            document.ttform.subj_code.options[101]=new Option("NANO - Nanoscience","NANO",false, false);
-            document.ttform.subj_code.options[102]=new Option("NEUR - Neuroscience","NEUR",false, false);
-            document.ttform.subj_code.options[103]=new Option("NR - Natural Resources","NR",false, false);
-            document.ttform.subj_code.options[104]=new Option("NSEG - Nuclear Science and Engineering","NSEG",false, false);
-            document.ttform.subj_code.options[105]=new Option("PAPA - Public Administration/Public Affairs","PAPA",false, false);
-            document.ttform.subj_code.options[106]=new Option("PHIL - Philosophy","PHIL",false, false);
-            document.ttform.subj_code.options[107]=new Option("PHS - Population Health Sciences","PHS",false, false);
-            document.ttform.subj_code.options[108]=new Option("PHYS - Physics","PHYS",false, false);
-            document.ttform.subj_code.options[109]=new Option("PM - Property Management","PM",false, false);
-            document.ttform.subj_code.options[110]=new Option("PPE - Philosophy, Politics, and Economics","PPE",false, false);
-            document.ttform.subj_code.options[111]=new Option("PR - Public Relations","PR",false, false);
-            document.ttform.subj_code.options[112]=new Option("PSCI - Political Science","PSCI",false, false);
-            document.ttform.subj_code.options[113]=new Option("PSYC - Psychology","PSYC",false, false);
-            document.ttform.subj_code.options[114]=new Option("REAL - Real Estate","REAL",false, false);
-            document.ttform.subj_code.options[115]=new Option("RED - Residential Environments and Design","RED",false, false);
-            document.ttform.subj_code.options[116]=new Option("RLCL - Religion and Culture","RLCL",false, false);
-            document.ttform.subj_code.options[117]=new Option("RUS - Russian","RUS",false, false);
-            document.ttform.subj_code.options[118]=new Option("SBIO - Sustainable Biomaterials","SBIO",false, false);
-            document.ttform.subj_code.options[119]=new Option("SOC - Sociology","SOC",false, false);
-            document.ttform.subj_code.options[120]=new Option("SPAN - Spanish","SPAN",false, false);
-            document.ttform.subj_code.options[121]=new Option("SPES - School of Plant and Environmental Sciences","SPES",false, false);
-            document.ttform.subj_code.options[122]=new Option("SPIA - School of Public and International Affairs","SPIA",false, false);
-            document.ttform.subj_code.options[123]=new Option("STAT - Statistics","STAT",false, false);
-            document.ttform.subj_code.options[124]=new Option("STS - Science and Technology Studies","STS",false, false);
-            document.ttform.subj_code.options[125]=new Option("SYSB - Systems Biology","SYSB",false, false);
-            document.ttform.subj_code.options[126]=new Option("TA - Theatre Arts","TA",false, false);
-            document.ttform.subj_code.options[127]=new Option("TBMH - Translational Biology, Medicine and Health","TBMH",false, false);
-            document.ttform.subj_code.options[128]=new Option("UAP - Urban Affairs and Planning","UAP",false, false);
-            document.ttform.subj_code.options[129]=new Option("UH - University Honors","UH",false, false);
-            document.ttform.subj_code.options[130]=new Option("UNIV - University Course Series","UNIV",false, false);
-            document.ttform.subj_code.options[131]=new Option("VM - Veterinary Medicine","VM",false, false);
-            document.ttform.subj_code.options[132]=new Option("WGS - Women's and Gender Studies","WGS",false, false);
-
-
-            break;
-
-
-            case "202509" :
-            document.ttform.subj_code.options[0]=new Option("All Subjects","%",false, false);
-            document.ttform.subj_code.options[1]=new Option("AAD - Architecture, Arts, and Design","AAD",false, false);
-            document.ttform.subj_code.options[2]=new Option("AAEC - Agricultural and Applied Economics","AAEC",false, false);
-            document.ttform.subj_code.options[3]=new Option("ACIS - Accounting and Information Systems","ACIS",false, false);
-            document.ttform.subj_code.options[4]=new Option("ADS - Applied Data Science","ADS",false, false);
-            document.ttform.subj_code.options[5]=new Option("ADV - Advertising","ADV",false, false);
-            document.ttform.subj_code.options[6]=new Option("AFST - Africana Studies","AFST",false, false);
-            document.ttform.subj_code.options[7]=new Option("AHRM - Apparel, Housing, and Resource Management","AHRM",false, false);
-            document.ttform.subj_code.options[8]=new Option("AINS - American Indian Studies","AINS",false, false);
-            document.ttform.subj_code.options[9]=new Option("AIS - Academy of Integrated Science","AIS",false, false);
-            document.ttform.subj_code.options[10]=new Option("ALCE - Agricultural, Leadership, and Community Education","ALCE",false, false);
-            document.ttform.subj_code.options[11]=new Option("ALS - Agriculture and Life Sciences","ALS",false, false);
-            document.ttform.subj_code.options[12]=new Option("AOE - Aerospace and Ocean Engineering","AOE",false, false);
-            document.ttform.subj_code.options[13]=new Option("APS - Appalachian Studies","APS",false, false);
-            document.ttform.subj_code.options[14]=new Option("APSC - Animal and Poultry Sciences","APSC",false, false);
-            document.ttform.subj_code.options[15]=new Option("ARBC - Arabic","ARBC",false, false);
-            document.ttform.subj_code.options[16]=new Option("ARCH - Architecture","ARCH",false, false);
-            document.ttform.subj_code.options[17]=new Option("ART - Art and Art History","ART",false, false);
-            document.ttform.subj_code.options[18]=new Option("AS - Military Aerospace Studies","AS",false, false);
-            document.ttform.subj_code.options[19]=new Option("ASPT - Alliance for Social, Political, Ethical, and Cultural Thought","ASPT",false, false);
-            document.ttform.subj_code.options[20]=new Option("AT - Agricultural Technology","AT",false, false);
-            document.ttform.subj_code.options[21]=new Option("BC - Building Construction","BC",false, false);
-            document.ttform.subj_code.options[22]=new Option("BCHM - Biochemistry","BCHM",false, false);
-            document.ttform.subj_code.options[23]=new Option("BDS - Behavioral Decision Science","BDS",false, false);
-            document.ttform.subj_code.options[24]=new Option("BIOL - Biological Sciences","BIOL",false, false);
-            document.ttform.subj_code.options[25]=new Option("BIT - Business Information Technology","BIT",false, false);
-            document.ttform.subj_code.options[26]=new Option("BMES - Biomedical Engineering and Sciences","BMES",false, false);
-            document.ttform.subj_code.options[27]=new Option("BMSP - Biomedical Sciences and Pathobiology","BMSP",false, false);
-            document.ttform.subj_code.options[28]=new Option("BMVS - Biomedical and Veterinary Sciences","BMVS",false, false);
-            document.ttform.subj_code.options[29]=new Option("BSE - Biological Systems Engineering","BSE",false, false);
-            document.ttform.subj_code.options[30]=new Option("CEE - Civil and Environmental Engineering","CEE",false, false);
-            document.ttform.subj_code.options[31]=new Option("CEM - Construction Engineering and Management","CEM",false, false);
-            document.ttform.subj_code.options[32]=new Option("CHE - Chemical Engineering","CHE",false, false);
-            document.ttform.subj_code.options[33]=new Option("CHEM - Chemistry","CHEM",false, false);
-            document.ttform.subj_code.options[34]=new Option("CHN - Chinese","CHN",false, false);
-            document.ttform.subj_code.options[35]=new Option("CINE - Cinema","CINE",false, false);
-            document.ttform.subj_code.options[36]=new Option("CLA - Classical Studies","CLA",false, false);
-            document.ttform.subj_code.options[37]=new Option("CMDA - Computational Modeling and Data Analytics","CMDA",false, false);
-            document.ttform.subj_code.options[38]=new Option("CMST - Communication Studies","CMST",false, false);
-            document.ttform.subj_code.options[39]=new Option("CNST - Construction","CNST",false, false);
-            document.ttform.subj_code.options[40]=new Option("COMM - Communication","COMM",false, false);
-            document.ttform.subj_code.options[41]=new Option("CONS - Consumer Studies","CONS",false, false);
-            document.ttform.subj_code.options[42]=new Option("COS - College of Science","COS",false, false);
-            document.ttform.subj_code.options[43]=new Option("CRIM - Criminology","CRIM",false, false);
-            document.ttform.subj_code.options[44]=new Option("CS - Computer Science","CS",false, true);
-            document.ttform.subj_code.options[45]=new Option("CSES - Crop and Soil Environmental Sciences","CSES",false, false);
-            document.ttform.subj_code.options[46]=new Option("DANC - Dance","DANC",false, false);
-            document.ttform.subj_code.options[47]=new Option("DASC - Dairy Science","DASC",false, false);
-            document.ttform.subj_code.options[48]=new Option("ECE - Electrical and Computer Engineering","ECE",false, false);
-            document.ttform.subj_code.options[49]=new Option("ECON - Economics","ECON",false, false);
-            document.ttform.subj_code.options[50]=new Option("EDCI - Education, Curriculum and Instruction","EDCI",false, false);
-            document.ttform.subj_code.options[51]=new Option("EDCO - Counselor Education","EDCO",false, false);
-            document.ttform.subj_code.options[52]=new Option("EDCT - Career and Technical Education","EDCT",false, false);
-            document.ttform.subj_code.options[53]=new Option("EDEL - Educational Leadership","EDEL",false, false);
-            document.ttform.subj_code.options[54]=new Option("EDEP - Educational Psychology","EDEP",false, false);
-            document.ttform.subj_code.options[55]=new Option("EDHE - Higher Education","EDHE",false, false);
-            document.ttform.subj_code.options[56]=new Option("EDIT - Instructional Design and Technology","EDIT",false, false);
-            document.ttform.subj_code.options[57]=new Option("EDP - Environmental Design and Planning","EDP",false, false);
-            document.ttform.subj_code.options[58]=new Option("EDRE - Education, Research and Evaluation","EDRE",false, false);
-            document.ttform.subj_code.options[59]=new Option("EDTE - Technology Education","EDTE",false, false);
-            document.ttform.subj_code.options[60]=new Option("ENGE - Engineering Education","ENGE",false, false);
-            document.ttform.subj_code.options[61]=new Option("ENGL - English","ENGL",false, false);
-            document.ttform.subj_code.options[62]=new Option("ENGR - Engineering","ENGR",false, false);
-            document.ttform.subj_code.options[63]=new Option("ENSC - Environmental Science","ENSC",false, false);
-            document.ttform.subj_code.options[64]=new Option("ENT - Entomology","ENT",false, false);
-            document.ttform.subj_code.options[65]=new Option("ES - Environmental Security","ES",false, false);
-            document.ttform.subj_code.options[66]=new Option("ESM - Engineering Science and Mechanics","ESM",false, false);
-            document.ttform.subj_code.options[67]=new Option("FIN - Finance","FIN",false, false);
-            document.ttform.subj_code.options[68]=new Option("FIW - Fish and Wildlife Conservation","FIW",false, false);
-            document.ttform.subj_code.options[69]=new Option("FL - Modern and Classical Languages and Literatures","FL",false, false);
-            document.ttform.subj_code.options[70]=new Option("FMD - Fashion Merchandising and Design","FMD",false, false);
-            document.ttform.subj_code.options[71]=new Option("FR - French","FR",false, false);
-            document.ttform.subj_code.options[72]=new Option("FREC - Forest Resources and Environmental Conservation","FREC",false, false);
-            document.ttform.subj_code.options[73]=new Option("FST - Food Science and Technology","FST",false, false);
-            document.ttform.subj_code.options[74]=new Option("GBCB - Genetics, Bioinformatics, Computational Biology","GBCB",false, false);
-            document.ttform.subj_code.options[75]=new Option("GEOG - Geography","GEOG",false, false);
-            document.ttform.subj_code.options[76]=new Option("GEOS - Geosciences","GEOS",false, false);
-            document.ttform.subj_code.options[77]=new Option("GER - German","GER",false, false);
-            document.ttform.subj_code.options[78]=new Option("GIA - Government and International Affairs","GIA",false, false);
-            document.ttform.subj_code.options[79]=new Option("GR - Greek","GR",false, false);
-            document.ttform.subj_code.options[80]=new Option("GRAD - Graduate School","GRAD",false, false);
-            document.ttform.subj_code.options[81]=new Option("HD - Human Development","HD",false, false);
-            document.ttform.subj_code.options[82]=new Option("HEB - Hebrew","HEB",false, false);
-            document.ttform.subj_code.options[83]=new Option("HIST - History","HIST",false, false);
-            document.ttform.subj_code.options[84]=new Option("HNFE - Human Nutrition, Foods and Exercise","HNFE",false, false);
-            document.ttform.subj_code.options[85]=new Option("HORT - Horticulture","HORT",false, false);
-            document.ttform.subj_code.options[86]=new Option("HTM - Hospitality and Tourism Management","HTM",false, false);
-            document.ttform.subj_code.options[87]=new Option("HUM - Humanities","HUM",false, false);
-            document.ttform.subj_code.options[88]=new Option("IDS - Industrial Design","IDS",false, false);
-            document.ttform.subj_code.options[89]=new Option("IS - International Studies","IS",false, false);
-            document.ttform.subj_code.options[90]=new Option("ISC - Integrated Science","ISC",false, false);
-            document.ttform.subj_code.options[91]=new Option("ISE - Industrial and Systems Engineering","ISE",false, false);
-            document.ttform.subj_code.options[92]=new Option("ITAL - Italian","ITAL",false, false);
-            document.ttform.subj_code.options[93]=new Option("ITDS - Interior Design","ITDS",false, false);
-            document.ttform.subj_code.options[94]=new Option("JMC - Journalism and Mass Communication","JMC",false, false);
-            document.ttform.subj_code.options[95]=new Option("JPN - Japanese","JPN",false, false);
-            document.ttform.subj_code.options[96]=new Option("JUD - Judaic Studies","JUD",false, false);
-            document.ttform.subj_code.options[97]=new Option("LAHS - Liberal Arts and Human Sciences","LAHS",false, false);
-            document.ttform.subj_code.options[98]=new Option("LAR - Landscape Architecture","LAR",false, false);
-            document.ttform.subj_code.options[99]=new Option("LAT - Latin","LAT",false, false);
-            document.ttform.subj_code.options[100]=new Option("LDRS - Leadership Studies","LDRS",false, false);
-            document.ttform.subj_code.options[101]=new Option("MACR - Macromolecular Science and Engineering","MACR",false, false);
-            document.ttform.subj_code.options[102]=new Option("MATH - Mathematics","MATH",false, false);
-            document.ttform.subj_code.options[103]=new Option("ME - Mechanical Engineering","ME",false, false);
-            document.ttform.subj_code.options[104]=new Option("MED - Medicine","MED",false, false);
-            document.ttform.subj_code.options[105]=new Option("MGT - Management","MGT",false, false);
-            document.ttform.subj_code.options[106]=new Option("MINE - Mining Engineering","MINE",false, false);
-            document.ttform.subj_code.options[107]=new Option("MKTG - Marketing","MKTG",false, false);
-            document.ttform.subj_code.options[108]=new Option("MN - Military Navy","MN",false, false);
-            document.ttform.subj_code.options[109]=new Option("MS - Military Science (AROTC)","MS",false, false);
-            document.ttform.subj_code.options[110]=new Option("MSE - Materials Science and Engineering","MSE",false, false);
-            document.ttform.subj_code.options[111]=new Option("MTRG - Meteorology","MTRG",false, false);
-            document.ttform.subj_code.options[112]=new Option("MUS - Music","MUS",false, false);
-            document.ttform.subj_code.options[113]=new Option("NANO - Nanoscience","NANO",false, false);
-            document.ttform.subj_code.options[114]=new Option("NEUR - Neuroscience","NEUR",false, false);
-            document.ttform.subj_code.options[115]=new Option("NR - Natural Resources","NR",false, false);
-            document.ttform.subj_code.options[116]=new Option("NSEG - Nuclear Science and Engineering","NSEG",false, false);
-            document.ttform.subj_code.options[117]=new Option("PAPA - Public Administration/Public Affairs","PAPA",false, false);
-            document.ttform.subj_code.options[118]=new Option("PHIL - Philosophy","PHIL",false, false);
-            document.ttform.subj_code.options[119]=new Option("PHS - Population Health Sciences","PHS",false, false);
-            document.ttform.subj_code.options[120]=new Option("PHYS - Physics","PHYS",false, false);
-            document.ttform.subj_code.options[121]=new Option("PM - Property Management","PM",false, false);
-            document.ttform.subj_code.options[122]=new Option("PORT - Portuguese","PORT",false, false);
-            document.ttform.subj_code.options[123]=new Option("PPE - Philosophy, Politics, and Economics","PPE",false, false);
-            document.ttform.subj_code.options[124]=new Option("PPWS - Plant Pathology, Physiology and Weed Science","PPWS",false, false);
-            document.ttform.subj_code.options[125]=new Option("PR - Public Relations","PR",false, false);
-            document.ttform.subj_code.options[126]=new Option("PSCI - Political Science","PSCI",false, false);
-            document.ttform.subj_code.options[127]=new Option("PSVP - Peace Studies","PSVP",false, false);
-            document.ttform.subj_code.options[128]=new Option("PSYC - Psychology","PSYC",false, false);
-            document.ttform.subj_code.options[129]=new Option("REAL - Real Estate","REAL",false, false);
-            document.ttform.subj_code.options[130]=new Option("RED - Residential Environments and Design","RED",false, false);
-            document.ttform.subj_code.options[131]=new Option("RLCL - Religion and Culture","RLCL",false, false);
-            document.ttform.subj_code.options[132]=new Option("RTM - Research in Translational Medicine","RTM",false, false);
-            document.ttform.subj_code.options[133]=new Option("RUS - Russian","RUS",false, false);
-            document.ttform.subj_code.options[134]=new Option("SBIO - Sustainable Biomaterials","SBIO",false, false);
-            document.ttform.subj_code.options[135]=new Option("SOC - Sociology","SOC",false, false);
-            document.ttform.subj_code.options[136]=new Option("SPAN - Spanish","SPAN",false, false);
-            document.ttform.subj_code.options[137]=new Option("SPES - School of Plant and Environmental Sciences","SPES",false, false);
-            document.ttform.subj_code.options[138]=new Option("SPIA - School of Public and International Affairs","SPIA",false, false);
-            document.ttform.subj_code.options[139]=new Option("STAT - Statistics","STAT",false, false);
-            document.ttform.subj_code.options[140]=new Option("STL - Science, Technology, & Law","STL",false, false);
-            document.ttform.subj_code.options[141]=new Option("STS - Science and Technology Studies","STS",false, false);
-            document.ttform.subj_code.options[142]=new Option("SYSB - Systems Biology","SYSB",false, false);
-            document.ttform.subj_code.options[143]=new Option("TA - Theatre Arts","TA",false, false);
-            document.ttform.subj_code.options[144]=new Option("TBMH - Translational Biology, Medicine and Health","TBMH",false, false);
-            document.ttform.subj_code.options[145]=new Option("UAP - Urban Affairs and Planning","UAP",false, false);
-            document.ttform.subj_code.options[146]=new Option("UH - University Honors","UH",false, false);
-            document.ttform.subj_code.options[147]=new Option("UNIV - University Course Series","UNIV",false, false);
-            document.ttform.subj_code.options[148]=new Option("VM - Veterinary Medicine","VM",false, false);
-            document.ttform.subj_code.options[149]=new Option("WATR - Water","WATR",false, false);
-            document.ttform.subj_code.options[150]=new Option("WGS - Women's and Gender Studies","WGS",false, false);
-
-
-            break;
-
-
-            default:
-            document.ttform.subj_code.options[0]=new Option("All Subjects","%",false, false);
-            document.ttform.subj_code.options[1]=new Option("AAD - Architecture, Arts, and Design","AAD",false, false);
-            document.ttform.subj_code.options[2]=new Option("AAEC - Agricultural and Applied Economics","AAEC",false, false);
-            document.ttform.subj_code.options[3]=new Option("ACIS - Accounting and Information Systems","ACIS",false, false);
-            document.ttform.subj_code.options[4]=new Option("ADS - Applied Data Science","ADS",false, false);
-            document.ttform.subj_code.options[5]=new Option("ADV - Advertising","ADV",false, false);
-            document.ttform.subj_code.options[6]=new Option("AFST - Africana Studies","AFST",false, false);
-            document.ttform.subj_code.options[7]=new Option("AHRM - Apparel, Housing, and Resource Management","AHRM",false, false);
-            document.ttform.subj_code.options[8]=new Option("AINS - American Indian Studies","AINS",false, false);
-            document.ttform.subj_code.options[9]=new Option("AIS - Academy of Integrated Science","AIS",false, false);
-            document.ttform.subj_code.options[10]=new Option("ALCE - Agricultural, Leadership, and Community Education","ALCE",false, false);
-            document.ttform.subj_code.options[11]=new Option("ALS - Agriculture and Life Sciences","ALS",false, false);
-            document.ttform.subj_code.options[12]=new Option("AOE - Aerospace and Ocean Engineering","AOE",false, false);
-            document.ttform.subj_code.options[13]=new Option("APS - Appalachian Studies","APS",false, false);
-            document.ttform.subj_code.options[14]=new Option("APSC - Animal and Poultry Sciences","APSC",false, false);
-            document.ttform.subj_code.options[15]=new Option("ARBC - Arabic","ARBC",false, false);
-            document.ttform.subj_code.options[16]=new Option("ARCH - Architecture","ARCH",false, false);
-            document.ttform.subj_code.options[17]=new Option("ART - Art and Art History","ART",false, false);
-            document.ttform.subj_code.options[18]=new Option("AS - Military Aerospace Studies","AS",false, false);
-            document.ttform.subj_code.options[19]=new Option("ASPT - Alliance for Social, Political, Ethical, and Cultural Thought","ASPT",false, false);
-            document.ttform.subj_code.options[20]=new Option("AT - Agricultural Technology","AT",false, false);
-            document.ttform.subj_code.options[21]=new Option("BC - Building Construction","BC",false, false);
-            document.ttform.subj_code.options[22]=new Option("BCHM - Biochemistry","BCHM",false, false);
-            document.ttform.subj_code.options[23]=new Option("BDS - Behavioral Decision Science","BDS",false, false);
-            document.ttform.subj_code.options[24]=new Option("BIOL - Biological Sciences","BIOL",false, false);
-            document.ttform.subj_code.options[25]=new Option("BIT - Business Information Technology","BIT",false, false);
-            document.ttform.subj_code.options[26]=new Option("BMES - Biomedical Engineering and Sciences","BMES",false, false);
-            document.ttform.subj_code.options[27]=new Option("BMSP - Biomedical Sciences and Pathobiology","BMSP",false, false);
-            document.ttform.subj_code.options[28]=new Option("BMVS - Biomedical and Veterinary Sciences","BMVS",false, false);
-            document.ttform.subj_code.options[29]=new Option("BSE - Biological Systems Engineering","BSE",false, false);
-            document.ttform.subj_code.options[30]=new Option("CEE - Civil and Environmental Engineering","CEE",false, false);
-            document.ttform.subj_code.options[31]=new Option("CEM - Construction Engineering and Management","CEM",false, false);
-            document.ttform.subj_code.options[32]=new Option("CHE - Chemical Engineering","CHE",false, false);
-            document.ttform.subj_code.options[33]=new Option("CHEM - Chemistry","CHEM",false, false);
-            document.ttform.subj_code.options[34]=new Option("CHN - Chinese","CHN",false, false);
-            document.ttform.subj_code.options[35]=new Option("CINE - Cinema","CINE",false, false);
-            document.ttform.subj_code.options[36]=new Option("CLA - Classical Studies","CLA",false, false);
-            document.ttform.subj_code.options[37]=new Option("CMDA - Computational Modeling and Data Analytics","CMDA",false, false);
-            document.ttform.subj_code.options[38]=new Option("CMST - Communication Studies","CMST",false, false);
-            document.ttform.subj_code.options[39]=new Option("CNST - Construction","CNST",false, false);
-            document.ttform.subj_code.options[40]=new Option("COMM - Communication","COMM",false, false);
-            document.ttform.subj_code.options[41]=new Option("CONS - Consumer Studies","CONS",false, false);
-            document.ttform.subj_code.options[42]=new Option("COS - College of Science","COS",false, false);
-            document.ttform.subj_code.options[43]=new Option("CRIM - Criminology","CRIM",false, false);
-            document.ttform.subj_code.options[44]=new Option("CS - Computer Science","CS",false, true);
-            document.ttform.subj_code.options[45]=new Option("CSES - Crop and Soil Environmental Sciences","CSES",false, false);
-            document.ttform.subj_code.options[46]=new Option("DANC - Dance","DANC",false, false);
-            document.ttform.subj_code.options[47]=new Option("DASC - Dairy Science","DASC",false, false);
-            document.ttform.subj_code.options[48]=new Option("ECE - Electrical and Computer Engineering","ECE",false, false);
-            document.ttform.subj_code.options[49]=new Option("ECON - Economics","ECON",false, false);
-            document.ttform.subj_code.options[50]=new Option("EDCI - Education, Curriculum and Instruction","EDCI",false, false);
-            document.ttform.subj_code.options[51]=new Option("EDCO - Counselor Education","EDCO",false, false);
-            document.ttform.subj_code.options[52]=new Option("EDCT - Career and Technical Education","EDCT",false, false);
-            document.ttform.subj_code.options[53]=new Option("EDEL - Educational Leadership","EDEL",false, false);
-            document.ttform.subj_code.options[54]=new Option("EDEP - Educational Psychology","EDEP",false, false);
-            document.ttform.subj_code.options[55]=new Option("EDHE - Higher Education","EDHE",false, false);
-            document.ttform.subj_code.options[56]=new Option("EDIT - Instructional Design and Technology","EDIT",false, false);
-            document.ttform.subj_code.options[57]=new Option("EDP - Environmental Design and Planning","EDP",false, false);
-            document.ttform.subj_code.options[58]=new Option("EDRE - Education, Research and Evaluation","EDRE",false, false);
-            document.ttform.subj_code.options[59]=new Option("EDTE - Technology Education","EDTE",false, false);
-            document.ttform.subj_code.options[60]=new Option("ENGE - Engineering Education","ENGE",false, false);
-            document.ttform.subj_code.options[61]=new Option("ENGL - English","ENGL",false, false);
-            document.ttform.subj_code.options[62]=new Option("ENGR - Engineering","ENGR",false, false);
-            document.ttform.subj_code.options[63]=new Option("ENSC - Environmental Science","ENSC",false, false);
-            document.ttform.subj_code.options[64]=new Option("ENT - Entomology","ENT",false, false);
-            document.ttform.subj_code.options[65]=new Option("ES - Environmental Security","ES",false, false);
-            document.ttform.subj_code.options[66]=new Option("ESM - Engineering Science and Mechanics","ESM",false, false);
-            document.ttform.subj_code.options[67]=new Option("FIN - Finance","FIN",false, false);
-            document.ttform.subj_code.options[68]=new Option("FIW - Fish and Wildlife Conservation","FIW",false, false);
-            document.ttform.subj_code.options[69]=new Option("FL - Modern and Classical Languages and Literatures","FL",false, false);
-            document.ttform.subj_code.options[70]=new Option("FMD - Fashion Merchandising and Design","FMD",false, false);
-            document.ttform.subj_code.options[71]=new Option("FR - French","FR",false, false);
-            document.ttform.subj_code.options[72]=new Option("FREC - Forest Resources and Environmental Conservation","FREC",false, false);
-            document.ttform.subj_code.options[73]=new Option("FST - Food Science and Technology","FST",false, false);
-            document.ttform.subj_code.options[74]=new Option("GBCB - Genetics, Bioinformatics, Computational Biology","GBCB",false, false);
-            document.ttform.subj_code.options[75]=new Option("GEOG - Geography","GEOG",false, false);
-            document.ttform.subj_code.options[76]=new Option("GEOS - Geosciences","GEOS",false, false);
-            document.ttform.subj_code.options[77]=new Option("GER - German","GER",false, false);
-            document.ttform.subj_code.options[78]=new Option("GIA - Government and International Affairs","GIA",false, false);
-            document.ttform.subj_code.options[79]=new Option("GR - Greek","GR",false, false);
-            document.ttform.subj_code.options[80]=new Option("GRAD - Graduate School","GRAD",false, false);
-            document.ttform.subj_code.options[81]=new Option("HD - Human Development","HD",false, false);
-            document.ttform.subj_code.options[82]=new Option("HEB - Hebrew","HEB",false, false);
-            document.ttform.subj_code.options[83]=new Option("HIST - History","HIST",false, false);
-            document.ttform.subj_code.options[84]=new Option("HNFE - Human Nutrition, Foods and Exercise","HNFE",false, false);
-            document.ttform.subj_code.options[85]=new Option("HORT - Horticulture","HORT",false, false);
-            document.ttform.subj_code.options[86]=new Option("HTM - Hospitality and Tourism Management","HTM",false, false);
-            document.ttform.subj_code.options[87]=new Option("HUM - Humanities","HUM",false, false);
-            document.ttform.subj_code.options[88]=new Option("IDS - Industrial Design","IDS",false, false);
-            document.ttform.subj_code.options[89]=new Option("IS - International Studies","IS",false, false);
-            document.ttform.subj_code.options[90]=new Option("ISC - Integrated Science","ISC",false, false);
-            document.ttform.subj_code.options[91]=new Option("ISE - Industrial and Systems Engineering","ISE",false, false);
-            document.ttform.subj_code.options[92]=new Option("ITAL - Italian","ITAL",false, false);
-            document.ttform.subj_code.options[93]=new Option("ITDS - Interior Design","ITDS",false, false);
-            document.ttform.subj_code.options[94]=new Option("JMC - Journalism and Mass Communication","JMC",false, false);
-            document.ttform.subj_code.options[95]=new Option("JPN - Japanese","JPN",false, false);
-            document.ttform.subj_code.options[96]=new Option("JUD - Judaic Studies","JUD",false, false);
-            document.ttform.subj_code.options[97]=new Option("LAHS - Liberal Arts and Human Sciences","LAHS",false, false);
-            document.ttform.subj_code.options[98]=new Option("LAR - Landscape Architecture","LAR",false, false);
-            document.ttform.subj_code.options[99]=new Option("LAT - Latin","LAT",false, false);
-            document.ttform.subj_code.options[100]=new Option("LDRS - Leadership Studies","LDRS",false, false);
-            document.ttform.subj_code.options[101]=new Option("MACR - Macromolecular Science and Engineering","MACR",false, false);
-            document.ttform.subj_code.options[102]=new Option("MATH - Mathematics","MATH",false, false);
-            document.ttform.subj_code.options[103]=new Option("ME - Mechanical Engineering","ME",false, false);
-            document.ttform.subj_code.options[104]=new Option("MED - Medicine","MED",false, false);
-            document.ttform.subj_code.options[105]=new Option("MGT - Management","MGT",false, false);
-            document.ttform.subj_code.options[106]=new Option("MINE - Mining Engineering","MINE",false, false);
-            document.ttform.subj_code.options[107]=new Option("MKTG - Marketing","MKTG",false, false);
-            document.ttform.subj_code.options[108]=new Option("MN - Military Navy","MN",false, false);
-            document.ttform.subj_code.options[109]=new Option("MS - Military Science (AROTC)","MS",false, false);
-            document.ttform.subj_code.options[110]=new Option("MSE - Materials Science and Engineering","MSE",false, false);
-            document.ttform.subj_code.options[111]=new Option("MTRG - Meteorology","MTRG",false, false);
-            document.ttform.subj_code.options[112]=new Option("MUS - Music","MUS",false, false);
-            document.ttform.subj_code.options[113]=new Option("NANO - Nanoscience","NANO",false, false);
-            document.ttform.subj_code.options[114]=new Option("NEUR - Neuroscience","NEUR",false, false);
-            document.ttform.subj_code.options[115]=new Option("NR - Natural Resources","NR",false, false);
-            document.ttform.subj_code.options[116]=new Option("NSEG - Nuclear Science and Engineering","NSEG",false, false);
-            document.ttform.subj_code.options[117]=new Option("PAPA - Public Administration/Public Affairs","PAPA",false, false);
-            document.ttform.subj_code.options[118]=new Option("PHIL - Philosophy","PHIL",false, false);
-            document.ttform.subj_code.options[119]=new Option("PHS - Population Health Sciences","PHS",false, false);
-            document.ttform.subj_code.options[120]=new Option("PHYS - Physics","PHYS",false, false);
-            document.ttform.subj_code.options[121]=new Option("PM - Property Management","PM",false, false);
-            document.ttform.subj_code.options[122]=new Option("PORT - Portuguese","PORT",false, false);
-            document.ttform.subj_code.options[123]=new Option("PPE - Philosophy, Politics, and Economics","PPE",false, false);
-            document.ttform.subj_code.options[124]=new Option("PPWS - Plant Pathology, Physiology and Weed Science","PPWS",false, false);
-            document.ttform.subj_code.options[125]=new Option("PR - Public Relations","PR",false, false);
-            document.ttform.subj_code.options[126]=new Option("PSCI - Political Science","PSCI",false, false);
-            document.ttform.subj_code.options[127]=new Option("PSVP - Peace Studies","PSVP",false, false);
-            document.ttform.subj_code.options[128]=new Option("PSYC - Psychology","PSYC",false, false);
-            document.ttform.subj_code.options[129]=new Option("REAL - Real Estate","REAL",false, false);
-            document.ttform.subj_code.options[130]=new Option("RED - Residential Environments and Design","RED",false, false);
-            document.ttform.subj_code.options[131]=new Option("RLCL - Religion and Culture","RLCL",false, false);
-            document.ttform.subj_code.options[132]=new Option("RTM - Research in Translational Medicine","RTM",false, false);
-            document.ttform.subj_code.options[133]=new Option("RUS - Russian","RUS",false, false);
-            document.ttform.subj_code.options[134]=new Option("SBIO - Sustainable Biomaterials","SBIO",false, false);
-            document.ttform.subj_code.options[135]=new Option("SOC - Sociology","SOC",false, false);
-            document.ttform.subj_code.options[136]=new Option("SPAN - Spanish","SPAN",false, false);
-            document.ttform.subj_code.options[137]=new Option("SPES - School of Plant and Environmental Sciences","SPES",false, false);
-            document.ttform.subj_code.options[138]=new Option("SPIA - School of Public and International Affairs","SPIA",false, false);
-            document.ttform.subj_code.options[139]=new Option("STAT - Statistics","STAT",false, false);
-            document.ttform.subj_code.options[140]=new Option("STL - Science, Technology, & Law","STL",false, false);
-            document.ttform.subj_code.options[141]=new Option("STS - Science and Technology Studies","STS",false, false);
-            document.ttform.subj_code.options[142]=new Option("SYSB - Systems Biology","SYSB",false, false);
-            document.ttform.subj_code.options[143]=new Option("TA - Theatre Arts","TA",false, false);
-            document.ttform.subj_code.options[144]=new Option("TBMH - Translational Biology, Medicine and Health","TBMH",false, false);
-            document.ttform.subj_code.options[145]=new Option("UAP - Urban Affairs and Planning","UAP",false, false);
-            document.ttform.subj_code.options[146]=new Option("UH - University Honors","UH",false, false);
-            document.ttform.subj_code.options[147]=new Option("UNIV - University Course Series","UNIV",false, false);
-            document.ttform.subj_code.options[148]=new Option("VM - Veterinary Medicine","VM",false, false);
-            document.ttform.subj_code.options[149]=new Option("WATR - Water","WATR",false, false);
-            document.ttform.subj_code.options[150]=new Option("WGS - Women's and Gender Studies","WGS",false, false);
-
-
-            break;
-
-
-            }
-            return true;
-            }
-            </script>
-
-            """
-
-            # Sample HTML for scrape_subject('CS')
-            self.cs_subject_html = """
-            <table class="dataentrytable">
-                <tr><th>CRN</th><th>Course</th><th>Title</th><th>Type</th><th>Modality</th><th>Hours</th><th>Cap</th><th>Instructor</th><th>Days</th><th>Begin</th><th>End</th><th>Location</th><th>Exam</th></tr>
-                <tr>
-                    <td><b>83488</b></td><td><font>CS-2114</font></td><td>Softw Des & Data Structures</td>
-                    <td>L</td><td><p>Face-to-Face</p></td><td>3</td><td>35</td><td>N/A</td>
-                    <td>T R</td><td>9:30AM</td><td>10:20AM</td><td>GOODW 190</td><td><a>CTE</a></td>
-                </tr>
-                <tr>
-                    <td><b>12345</b></td><td><font>CS-1064</font></td><td>Intro to Programming</td>
-                    <td>L</td><td><p>Online</p></td><td>3</td><td>100</td><td>John Doe</td>
-                    <td>(ARR)</td><td>-----</td><td>Online</td><td><a>CTE</a></td>
-                </tr>
-            </table>
-            """
-
-            # Sample HTML for scrape_subject('MATH')
-            self.math_subject_html = """
-            <table class="dataentrytable">
-                <tr><th>CRN</th><th>Course</th><th>Title</th><th>Type</th><th>Modality</th><th>Hours</th><th>Cap</th><th>Instructor</th><th>Days</th><th>Begin</th><th>End</th><th>Location</th><th>Exam</th></tr>
-                <tr>
-                    <td><b>54321</b></td><td><font>MATH-1225</font></td><td>Calculus I</td>
-                    <td>L</td><td><p>Face-to-Face</p></td><td>4</td><td>150</td><td>Jane Smith</td>
-                    <td>M W F</td><td>11:15AM</td><td>12:05PM</td><td>MCB 110</td><td><a>CTE</a></td>
-                </tr>
-                <tr>
-                    <td><b>65432</b></td><td><font>MATH-1226</font></td><td>Calculus II</td>
-                    <td>L</td><td><p>Face-to-Face</p></td><td>4</td><td>120</td><td>Bob Johnson</td>
-                    <td>T R</td><td>2:00PM</td><td>3:15PM</td><td>MCB 120</td><td><a>CTE</a></td>
-                </tr>
-            </table>
-            """
-
-            # Sample HTML for a subject with no courses (PHYS)
-            self.empty_subject_html = """
-            <table class="dataentrytable">
-                <tr><th>CRN</th><th>Course</th><th>Title</th><th>Type</th><th>Modality</th><th>Hours</th><th>Cap</th><th>Instructor</th><th>Days</th><th>Begin</th><th>End</th><th>Location</th><th>Exam</th></tr>
-            </table>
-            """
-
-            # Sample HTML for a subject that returns no table
-            self.no_table_html = "<html><body><p>No data found</p></body></html>"
-
-            def fetch_html_side_effect(subject):
-                if subject == "%":
-                    return self.subjects_html
-                elif subject == "CS":
-                    return self.cs_subject_html
-                elif subject == "MATH":
-                    return self.math_subject_html
-                elif subject == "PHYS":
-                    return self.empty_subject_html
-                else:
-                    return self.no_table_html
-
-            self.mock_fetcher.fetch_html.side_effect = fetch_html_side_effect
-
-            yield
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_fetcher_class, subjects_html):
+        """Sets up test fixtures for the TimetableScraper tests."""
+        self.term = "202509"
+        self.mock_fetcher = mock_fetcher_class.return_value
+        self.mock_fetcher.reset_mock(return_value=True, side_effect=True)
+
+        self.scraper = TimetableScraper(self.term)
+
+        # any other subject gets a page without a timetable
+        pages = {
+            "%": subjects_html,
+            "CS": self.cs_subject_html,
+            "MATH": self.math_subject_html,
+            "PHYS": self.empty_subject_html,
+        }
+        self.mock_fetcher.fetch_html.side_effect = lambda subject: pages.get(
+            subject, self.no_table_html
+        )
 
     def test_get_subjects_success(self):
         """Test get_subjects successfully retrieves and parses subjects."""
@@ -1714,6 +1433,16 @@ class TestTimetableScraper:
         assert len(subjects) == 150
         assert "CS" in subjects
 
+    def test_get_subjects_is_cached(self):
+        """Test get_subjects only fetches the dropdown page once."""
+        # Act
+        first = self.scraper.get_subjects()
+        second = self.scraper.get_subjects()
+
+        # Assert
+        assert first == second
+        self.mock_fetcher.fetch_html.assert_called_once_with("%")
+
     @patch("scraper.timetable_scraper.logging")
     @patch("scraper.timetable_scraper.TimetableFetcher")
     def test_get_subjects_null_return(self, mock_fetcher_class, mock_logging):
@@ -1730,8 +1459,8 @@ class TestTimetableScraper:
 
         # Assert
         mock_fetcher_instance.fetch_html.assert_called_once_with("%")
-        mock_logging.warning.assert_called_once_with(
-            "No HTML returned when retrieving all subjects"
+        assert_single_warning(
+            mock_logging, "No HTML returned when retrieving all subjects"
         )
         assert subjects == []
 
@@ -1768,8 +1497,8 @@ class TestTimetableScraper:
 
         # Assert
         mock_fetcher_instance.fetch_html.assert_called_once_with("%")
-        mock_logging.warning.assert_called_once_with(
-            "Could not find matching script when retrieving all subjects"
+        assert_single_warning(
+            mock_logging, "Could not find matching script when retrieving all subjects"
         )
         assert subjects == []
 
@@ -1852,9 +1581,7 @@ class TestTimetableScraper:
 
         # Assert
         self.mock_fetcher.fetch_html.assert_called_with("PHYS")
-        mock_logging.warning.assert_called_once_with(
-            "No data rows found for subject: PHYS"
-        )
+        assert_single_warning(mock_logging, "No data rows found for subject: PHYS")
         assert result == {}
 
     def test_scrape_multiple_subjects_success(self):
@@ -1884,6 +1611,30 @@ class TestTimetableScraper:
         assert "MATH" in result
         assert "INVALID" not in result  # Should not include empty results
 
+    def test_scrape_multiple_subjects_single_worker(self):
+        """Test scraping multiple subjects one at a time."""
+        # Arrange
+        scraper = TimetableScraper(self.term, max_workers=1)
+
+        # Act
+        result = scraper.scrape_multiple_subjects(["MATH", "CS"])
+
+        # Assert
+        assert list(result) == ["MATH", "CS"]
+
+    def test_fetcher_pool_matches_max_workers(self, mock_fetcher_class):
+        """Test that the fetcher keeps a pooled connection for every worker."""
+        # Act
+        TimetableScraper(self.term, max_workers=24)
+
+        # Assert
+        mock_fetcher_class.assert_called_with(self.term, pool_size=24)
+
+    def test_invalid_max_workers(self):
+        """Test that a scraper needs at least one worker."""
+        with pytest.raises(ValueError):
+            TimetableScraper(self.term, max_workers=0)
+
     def test_scrape_multiple_subjects_empty_list(self):
         """Test scraping with empty subjects list."""
         # Act
@@ -1957,6 +1708,20 @@ class TestTimetableScraper:
         # Assert
         assert result == {}
 
+    def test_find_course_reuses_index(self):
+        """Test that later course searches are answered without scraping again."""
+        # Arrange
+        assert self.scraper.find_course("CS-2114")
+        fetch_count = self.mock_fetcher.fetch_html.call_count
+
+        # Act
+        result = self.scraper.find_course("math-1226")
+
+        # Assert
+        assert list(result) == ["MATH"]
+        assert list(result["MATH"]) == ["MATH-1226"]
+        assert self.mock_fetcher.fetch_html.call_count == fetch_count
+
     def test_find_section_by_crn_success(self):
         """Test finding a section by CRN successfully."""
         # Act
@@ -1987,6 +1752,22 @@ class TestTimetableScraper:
             # Assert
             assert result is None
 
+    def test_get_all_sections_for_course_success(self):
+        """Test retrieving the sections of a course."""
+        # Act
+        result = self.scraper.get_all_sections_for_course("cs-2114")
+
+        # Assert
+        assert [section["crn"] for section in result] == ["83488"]
+
+    def test_get_all_sections_for_course_not_found(self):
+        """Test retrieving sections for a course the subject does not offer."""
+        # Act
+        result = self.scraper.get_all_sections_for_course("CS-9999")
+
+        # Assert
+        assert result == []
+
     def test_close_session(self):
         """Test closing the fetcher session."""
         # Act
@@ -2065,6 +1846,145 @@ class TestTimetableScraper:
         else:
             assert result is None
 
+    def test_find_section_by_crn_reuses_index(self):
+        """Test that later CRN lookups are answered without scraping again."""
+        # Arrange
+        assert self.scraper.find_section_by_crn("83488") is not None
+        fetch_count = self.mock_fetcher.fetch_html.call_count
+
+        # Act
+        result = self.scraper.find_section_by_crn("54321")
+
+        # Assert
+        assert result is not None
+        assert result["subject"] == "MATH"
+        assert result["course"] == "MATH-1225"
+        assert self.mock_fetcher.fetch_html.call_count == fetch_count
+
+    def test_find_section_by_crn_result_is_a_copy(self):
+        """Test that editing a lookup result does not change later lookups."""
+        # Arrange
+        result = self.scraper.find_section_by_crn("83488")
+        assert result is not None
+
+        # Act
+        result["course"] = "CHANGED"
+        result["section"]["title"] = "CHANGED"
+        result["section"]["meeting_times"].clear()
+
+        # Assert
+        again = self.scraper.find_section_by_crn("83488")
+        assert again is not None
+        assert again["course"] == "CS-2114"
+        assert again["section"]["title"] == "Softw Des & Data Structures"
+        assert len(again["section"]["meeting_times"]) == 2
+
+    def test_find_section_by_crn_retries_failed_subjects(self):
+        """Test that a transient subject failure is not cached in the CRN index."""
+        # Arrange
+        pages = self.mock_fetcher.fetch_html.side_effect
+        failures = {"CS"}
+
+        def fail_once(subject):
+            if subject in failures:
+                failures.discard(subject)
+                raise ConnectionError("Temporary failure")
+            return pages(subject)
+
+        self.mock_fetcher.fetch_html.side_effect = fail_once
+
+        # Act
+        first = self.scraper.find_section_by_crn("83488")
+        second = self.scraper.find_section_by_crn("83488")
+
+        # Assert
+        assert first is None
+        assert second is not None
+        assert second["subject"] == "CS"
+        assert self.scraper.crn_index is not None
+
+    def test_try_scrape_subjects_reports_failures(self):
+        """Test that subjects without sections are not reported as failures."""
+        # Arrange
+        self.mock_fetcher.fetch_html.side_effect = lambda subject: (
+            None if subject == "CS" else self.empty_subject_html
+        )
+
+        # Act
+        result, failed = self.scraper.try_scrape_subjects(["CS", "PHYS"])
+
+        # Assert
+        assert result == {}
+        assert failed == ["CS"]
+
+    def test_find_course_and_crn_share_one_scrape(self):
+        """Test that both lookup indexes are built from a single full scrape."""
+        # Arrange
+        fetch_count = self.mock_fetcher.fetch_html.call_count
+
+        # Act
+        self.scraper.find_course("CS-2114")
+        self.scraper.find_section_by_crn("83488")
+
+        # Assert
+        # one dropdown fetch plus one fetch per subject
+        assert self.mock_fetcher.fetch_html.call_count - fetch_count == 1 + 150
+        assert self.scraper.subjects_map is not None
+
+    def test_find_course_result_is_a_copy(self):
+        """Test that editing a search result does not change later searches."""
+        # Arrange
+        result = self.scraper.find_course("CS-2114")
+
+        # Act
+        sections = result["CS"]["CS-2114"]
+        sections[0]["title"] = "CHANGED"
+        sections.append({"crn": "00000"})
+        sections.pop(0)
+
+        # Assert
+        again = self.scraper.find_course("CS-2114")
+        assert [section["crn"] for section in again["CS"]["CS-2114"]] == ["83488"]
+        assert again["CS"]["CS-2114"][0]["title"] == "Softw Des & Data Structures"
+
+    def test_find_course_retries_failed_subjects(self):
+        """Test that a transient subject failure is not cached in the course index."""
+        # Arrange
+        pages = self.mock_fetcher.fetch_html.side_effect
+        failures = {"MATH"}
+
+        def fail_once(subject):
+            if subject in failures:
+                failures.discard(subject)
+                return None
+            return pages(subject)
+
+        self.mock_fetcher.fetch_html.side_effect = fail_once
+
+        # Act
+        first = self.scraper.find_course("MATH-1225")
+        second = self.scraper.find_course("MATH-1225")
+
+        # Assert
+        assert first == {}
+        assert "MATH-1225" in second["MATH"]
+        assert self.scraper.course_index is not None
+
+    def test_close_discards_indexes(self):
+        """Test that close() drops the cached subjects and lookup indexes."""
+        # Arrange
+        self.scraper.find_course("CS-2114")
+        self.scraper.find_section_by_crn("83488")
+
+        # Act
+        self.scraper.close()
+
+        # Assert
+        assert self.scraper.subjects is None
+        assert self.scraper.subjects_map is None
+        assert self.scraper.course_index is None
+        assert self.scraper.crn_index is None
+
     def test_scrape_multiple_subjects_preserves_order(self):
         """Test that scrape_multiple_subjects processes subjects in order."""
         # Arrange